@@ -0,0 +1,144 @@
+import time
+import numpy as np
+from tileworld.uncertainty_table import get_table
+
+# Vectorized version of the beta distribution robot (beta_distribution.py).
+# N robots, each in its own tile world, are advanced together one step at a
+# time with NumPy array operations instead of a Python loop per robot.
+
+class BatchSimulator:
+    def __init__(self, num_robots, world_length, noise_level=0.0, strategy='cautious', seed=None, tiles=None):
+        self.rng = np.random.default_rng(seed)
+        self.num_robots = num_robots
+        self.world_length = world_length
+
+        # Worlds: one row of black(0) and white(1) tiles per robot
+        if tiles is None:
+            self.tiles = self.rng.integers(0, 2, size=(num_robots, world_length), dtype=np.int8)
+        else:
+            self.tiles = np.broadcast_to(np.asarray(tiles, dtype=np.int8), (num_robots, world_length)).copy()
+
+        self.positions = self.rng.integers(0, world_length, size=num_robots)
+        self.counts = np.zeros((num_robots, world_length, 2), dtype=np.int32)  # Histogram: [black_count, white_count]
+        self.steps_taken = 0
+
+        # Convergence tracking: a tile is correct when its majority colour matches the world,
+        # and a robot has converged at the first step where all of its tiles are correct
+        self.correct = np.zeros((num_robots, world_length), dtype=bool)
+        self.num_correct = np.zeros(num_robots, dtype=np.int64)
+        self.converged_at = np.full(num_robots, -1, dtype=np.int64)
+
+        self.set_noise_level(noise_level)
+        self.set_strategy(strategy)
+
+        self._robots = np.arange(num_robots)
+
+    def set_noise_level(self, noise_level):
+        noise_level = np.asarray(noise_level, dtype=float)
+        if not np.all((noise_level >= 0.0) & (noise_level <= 0.5)):
+            raise ValueError("Noise level must be between 0.0 (no noise) and 0.5 (readings and moves are coin flips).")
+        self.noise_level = np.broadcast_to(noise_level, (self.num_robots,)).copy()
+
+    def set_strategy(self, strategy):
+        # A single strategy name for every robot, or one name per robot
+        strategy = np.broadcast_to(np.asarray(strategy), (self.num_robots,))
+        if not np.all(np.isin(strategy, ['cautious', 'adventurous'])):
+            raise ValueError("Unknown strategy. Choose 'cautious' or 'adventurous'.")
+        self.adventurous = strategy == 'adventurous'
+
+    @staticmethod
+    def uncertainty(black_count, white_count):
+        # Same beta variance as Robot.calculate_uncertainty, looked up in the shared table; 0.25 when there is no data
+        return get_table('beta').values(black_count, white_count)
+
+    def sense(self):
+        robots, positions = self._robots, self.positions
+        perceived = self.tiles[robots, positions]
+        flip = self.rng.random(self.num_robots) < self.noise_level
+        perceived = perceived ^ flip  # Flip perception with probability equal to noise level
+        self.counts[robots, positions, perceived] += 1
+
+        # Only the sensed tile can change correctness, so update the tally incrementally
+        counts = self.counts[robots, positions]
+        majority = np.sign(counts[:, 1] - counts[:, 0])
+        now_correct = majority == self.tiles[robots, positions] * 2 - 1
+        self.num_correct += now_correct.astype(np.int64) - self.correct[robots, positions]
+        self.correct[robots, positions] = now_correct
+        newly_converged = (self.num_correct == self.world_length) & (self.converged_at < 0)
+        self.converged_at[newly_converged] = self.steps_taken + 1
+
+    def choose_action(self):
+        robots, positions = self._robots, self.positions
+        last = self.world_length - 1
+
+        left = self.counts[robots, np.maximum(positions - 1, 0)]
+        right = self.counts[robots, np.minimum(positions + 1, last)]
+        left_uncertainty = self.uncertainty(left[:, 0], left[:, 1])
+        right_uncertainty = self.uncertainty(right[:, 0], right[:, 1])
+
+        # Cautious robots move towards minimum uncertainty, adventurous ones towards maximum
+        prefer_left = np.where(self.adventurous, left_uncertainty > right_uncertainty, left_uncertainty < right_uncertainty)
+        prefer_right = np.where(self.adventurous, right_uncertainty > left_uncertainty, right_uncertainty < left_uncertainty)
+        coin = self.rng.integers(0, 2, size=self.num_robots) * 2 - 1  # Random choice if uncertainty is equal
+        actions = np.where(prefer_left, -1, np.where(prefer_right, 1, coin))
+
+        actions[positions == last] = -1  # Move left if at the right edge
+        actions[positions == 0] = 1  # Move right if at the left edge
+        return actions
+
+    def move(self, actions):
+        flip = self.rng.random(self.num_robots) < self.noise_level
+        actions = np.where(flip, -actions, actions)  # Flip action with probability equal to noise level
+        self.positions = np.clip(self.positions + actions, 0, self.world_length - 1)
+
+    def run(self, steps):
+        for _ in range(steps):
+            self.sense()
+            actions = self.choose_action()
+            self.move(actions)
+            self.steps_taken += 1
+
+    def predictions(self):
+        # Fraction of white observations per tile, 0.5 where a tile has no data
+        total_counts = self.counts.sum(axis=2)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = self.counts[:, :, 1] / total_counts
+        return np.where(total_counts == 0, 0.5, means)
+
+    def posterior_means(self):
+        # Beta posterior mean (white_count + 1) / (total_count + 2) per tile
+        return (self.counts[:, :, 1] + 1) / (self.counts.sum(axis=2) + 2)
+
+    def variances(self):
+        return self.uncertainty(self.counts[:, :, 0], self.counts[:, :, 1])
+
+
+def main():
+    from tileworld import Robot, TileWorld
+
+    # Parameters
+    world_length = 6
+    steps = 40
+    num_robots = 10000
+    scalar_robots = 200
+
+    print(f"Running {scalar_robots} scalar robots for {steps} steps ... ")
+    start = time.perf_counter()
+    for _ in range(scalar_robots):
+        robot = Robot(TileWorld(world_length))
+        robot.set_noise_level(0.1)
+        robot.run(steps, 'adventurous')
+    scalar_rate = scalar_robots * steps / (time.perf_counter() - start)
+
+    print(f"Running {num_robots} batched robots for {steps} steps ... ")
+    start = time.perf_counter()
+    simulator = BatchSimulator(num_robots, world_length, noise_level=0.1, strategy='adventurous')
+    simulator.run(steps)
+    batch_rate = num_robots * steps / (time.perf_counter() - start)
+
+    print(f"Scalar:  {scalar_rate:,.0f} robot-steps/s")
+    print(f"Batched: {batch_rate:,.0f} robot-steps/s ({batch_rate / scalar_rate:.0f}x)")
+
+# Run the main function
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import argparse
+import importlib
+import json
+import platform
+import time
+import tracemalloc
+import numpy as np
+from tileworld.trajectory import make_trajectory
+
+# Benchmark of Robot.run for every robot variant over a range of world lengths
+# and step counts. Results are saved as JSON and can be compared against a
+# previously stored baseline to catch slowdowns of the step loop.
+
+VARIANTS = {
+    'general': ('general_robot', None),
+    'cautious': ('cautious_robot', 'cautious'),
+    'adventurous': ('adventurous_robot', 'adventurous'),
+    'beta_cautious': ('beta_distribution', 'cautious'),
+    'beta_adventurous': ('beta_distribution', 'adventurous'),
+}
+
+
+def make_robot(variant, world_length, trajectory='memory'):
+    module_name, strategy = VARIANTS[variant]
+    module = importlib.import_module(module_name)
+    robot = module.Robot(module.TileWorld(world_length), make_trajectory(trajectory, size=1000))
+    if module_name == 'beta_distribution':
+        robot.set_noise_level(0.1)
+    if strategy is None:
+        return robot, robot.run
+    return robot, lambda steps: robot.run(steps, strategy)
+
+
+def benchmark(variant, world_length, steps, chunk=1000, measure_memory=True, trajectory='memory'):
+    # Run `steps` steps in chunks; each chunk gives one per-step latency sample
+    robot, run = make_robot(variant, world_length, trajectory)
+    chunk = min(chunk, steps)
+    latencies = []
+
+    start = time.perf_counter()
+    done = 0
+    while done < steps:
+        n = min(chunk, steps - done)
+        chunk_start = time.perf_counter_ns()
+        run(n)
+        latencies.append((time.perf_counter_ns() - chunk_start) / n)
+        done += n
+    elapsed = time.perf_counter() - start
+
+    # Memory is measured in a second run, since tracing allocations slows the step loop down
+    peak_memory = None
+    if measure_memory:
+        del robot, run
+        tracemalloc.start()
+        robot, run = make_robot(variant, world_length, trajectory)
+        run(steps)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+    return {
+        'variant': variant,
+        'world_length': world_length,
+        'steps': steps,
+        'seconds': elapsed,
+        'steps_per_second': steps / elapsed,
+        'latency_ns': {'p50': p50, 'p90': p90, 'p99': p99},
+        'peak_memory_bytes': peak_memory,
+    }
+
+
+def compare(results, baseline, tolerance):
+    # Report every case whose steps/sec dropped by more than `tolerance` compared to the baseline
+    reference = {(r['variant'], r['world_length'], r['steps']): r for r in baseline['results']}
+    regressions = []
+    for result in results:
+        key = (result['variant'], result['world_length'], result['steps'])
+        if key not in reference:
+            continue
+        ratio = result['steps_per_second'] / reference[key]['steps_per_second']
+        print(f"{key[0]:>17} L={key[1]:<8} steps={key[2]:<9} {ratio:6.2f}x baseline")
+        if ratio < 1 - tolerance:
+            regressions.append(key)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark steps/second of the robot variants.')
+    parser.add_argument('--variants', nargs='+', default=list(VARIANTS), choices=list(VARIANTS))
+    parser.add_argument('--world-lengths', nargs='+', type=int, default=[6, 100, 10000, 1000000])
+    parser.add_argument('--steps', nargs='+', type=int, default=[10000, 100000])
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--baseline', help='JSON file from an earlier run to compare against')
+    parser.add_argument('--trajectory', default='memory', choices=['off', 'memory', 'ring'], help='how Robot.history is recorded')
+    parser.add_argument('--no-memory', action='store_true', help='skip the peak memory measurement run')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='allowed relative slowdown before a case counts as a regression')
+    args = parser.parse_args()
+
+    results = []
+    for variant in args.variants:
+        for world_length in args.world_lengths:
+            for steps in args.steps:
+                result = benchmark(variant, world_length, steps, measure_memory=not args.no_memory, trajectory=args.trajectory)
+                results.append(result)
+                memory = '' if result['peak_memory_bytes'] is None else f"  peak={result['peak_memory_bytes'] / 1e6:.1f} MB"
+                print(f"{variant:>17} L={world_length:<8} steps={steps:<9} {result['steps_per_second']:>12,.0f} steps/s  "
+                      f"p50={result['latency_ns']['p50']:,.0f} ns  p99={result['latency_ns']['p99']:,.0f} ns{memory}")
+
+    with open(args.output, 'w') as f:
+        json.dump({'python': platform.python_version(), 'machine': platform.machine(), 'results': results}, f, indent=2)
+    print(f"\nSaved results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"\nComparison against {args.baseline}:")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            raise SystemExit(f"{len(regressions)} case(s) slower than the baseline by more than {args.tolerance:.0%}")
+
+# Run the main function
+if __name__ == "__main__":
+    main()
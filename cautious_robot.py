@@ -1,122 +1,15 @@
-import random
-import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
-
-class TileWorld:
-    def __init__(self, length):
-        # Initialize the world with random black(0) and white(1) tiles
-        self.tiles = [random.choice([0, 1]) for _ in range(length)]
-        self.length = length
-
-class Robot:
-    def __init__(self, world):
-        self.world = world
-        self.position = random.randint(0, self.world.length - 1)
-        self.world_model = {i: [0, 0] for i in range(self.world.length)}  # Histogram: [black_count, white_count]
-        self.history = []
-
-    def sense(self):
-        # Simulate perception with 10% noise
-        perceived_color = self.world.tiles[self.position]
-        if random.random() < 0.1:
-            perceived_color = 1 - perceived_color  # Flip perception with 10% probability
-
-        # Update the histogram for the current position
-        if perceived_color == 0:
-            self.world_model[self.position][0] += 1
-        else:
-            self.world_model[self.position][1] += 1
-
-        self.history.append(self.position)
-
-    def predict_color(self, position):
-        black_count, white_count = self.world_model[position]
-        total_count = black_count + white_count
-        if total_count == 0:
-            return 0.5  # Initial prediction when no data
-        else:
-            return white_count / total_count
-
-    def choose_action(self, strategy='cautious'):
-        if strategy == 'cautious':
-            return self.cautious_strategy()
-        elif strategy == 'adventurous':
-            return self.adventurous_strategy()
-        else:
-            raise ValueError("Unknown strategy. Choose 'cautious' or 'adventurous'.")
-
-    def cautious_strategy(self):
-        if self.position == 0:
-            return 1  # Move right if at the left edge
-        elif self.position == self.world.length - 1:
-            return -1  # Move left if at the right edge
-
-        # Calculate uncertainty for left and right actions
-        left_uncertainty = self.calculate_uncertainty(self.position - 1)
-        right_uncertainty = self.calculate_uncertainty(self.position + 1)
-
-        # Choose action based on minimum uncertainty
-        if left_uncertainty < right_uncertainty:
-            return -1  # Move left
-        elif right_uncertainty < left_uncertainty:
-            return 1  # Move right
-        else:
-            return random.choice([-1, 1])  # Random choice if uncertainty is equal
-
-    def adventurous_strategy(self):
-        if self.position == 0:
-            return 1  # Move right if at the left edge
-        elif self.position == self.world.length - 1:
-            return -1  # Move left if at the right edge
-
-        # Calculate uncertainty for left and right actions
-        left_uncertainty = self.calculate_uncertainty(self.position - 1)
-        right_uncertainty = self.calculate_uncertainty(self.position + 1)
-
-        # Choose action based on maximum uncertainty
-        if left_uncertainty > right_uncertainty:
-            return -1  # Move left
-        elif right_uncertainty > left_uncertainty:
-            return 1  # Move right
-        else:
-            return random.choice([-1, 1])  # Random choice if uncertainty is equal
-
-    def calculate_uncertainty(self, position):
-        # Calculate uncertainty using binomial distribution variance
-        if position < 0 or position >= self.world.length:
-            return float('inf')  # High uncertainty if out of bounds
-
-        black_count, white_count = self.world_model[position]
-        total_count = black_count + white_count
-        if total_count == 0:
-            return 0.25  # Maximum uncertainty when no data
-        p = white_count / total_count
-        variance = p * (1 - p) / total_count
-        return variance
-
-    def move(self, action):
-        # Simulate action with 10% noise
-        if random.random() < 0.1:
-            action = -action  # Flip action with 10% probability
-
-        self.position += action
-        self.position = max(0, min(self.position, self.world.length - 1))
-
-    def run(self, steps, strategy='cautious'):
-        for _ in range(steps):
-            self.sense()
-            action = self.choose_action(strategy)
-            self.move(action)
-
-    @staticmethod
-    def generate_samples(mean, variance, size=1000):
-        if variance == 0:
-            variance = 0.0001  # Set a small variance if it is zero
-        stddev = np.sqrt(variance)
-        return np.random.normal(mean, stddev, size)
-
-def main():
+from plotting import density_grid, finish_figure, get_pyplot, normal_densities, parse_plot_args, plot_densities
+from tileworld import Robot as CoreRobot, TileWorld
+
+class Robot(CoreRobot):
+    # Binomial variance, 10% perception and action noise, moves towards the less uncertain neighbour
+    __slots__ = ()
+
+    def __init__(self, world, trajectory=None, seed=None):
+        super().__init__(world, trajectory, seed, model='binomial', noise_level=0.1, strategy='cautious')
+
+def main(plots=True, headless=False):
     # Parameters
     world_length = 6
     steps = 100
@@ -131,25 +24,24 @@ def main():
     robot.run(steps, strategy)
 
     print("World Tiles:", world.tiles)
-    print("Robot History:", robot.history)
+    print("Robot History:", list(robot.history))
 
     # Print final predictions and variances
     print("\nFinal Predictions and Variances:")
     means = []
     variances = []
     for pos in range(world_length):
-        black_count, white_count = robot.world_model[pos]
-        total_count = black_count + white_count
-        if total_count == 0:
-            mean = 0.5
-            variance = 0.25
-        else:
-            mean = white_count / total_count
-            variance = mean * (1 - mean) / total_count
+        mean = robot.predict_color(pos)
+        variance = robot.tile_variance(pos)
         means.append(mean)
         variances.append(variance)
         print(f"Position {pos}: Mean = {mean:.3f}, Variance = {variance:.3f}")
     
+    if not plots:
+        return
+
+    plt = get_pyplot(headless)
+
     # Create subplots
     fig, axes = plt.subplots(1, 2, figsize=(16, 6))
 
@@ -171,26 +63,22 @@ def main():
     ax.legend()
 
     #====== Plot the distribution of mean predictions across tile indices =====#
-    # Generate sample data for KDE plots
-    samples = [Robot.generate_samples(mean, var) for mean, var in zip(means, variances)]
     ax = axes[1]
 
-    # Plotting KDE for each tile index
-    for index, sample in enumerate(samples):
-        sns.kdeplot(sample, label=f'Tile {index}', linewidth=2)
+    # Gaussian approximation of each tile's posterior, evaluated on a fixed grid
+    grid = density_grid()
+    plot_densities(ax, grid, normal_densities(means, variances, grid))
 
     ax.set_xlabel('Mean Prediction')
     ax.set_ylabel('Density')
     ax.set_title('Distribution of Mean Predictions for Each Tile Index', fontsize=16, fontweight='bold')
-    ax.legend()
 
     # Set x-axis limits
     ax.set_xlim(-0.5, 1.5)
 
-    plt.savefig( str(strategy)+'_robot')
-    plt.tight_layout()
-    plt.show()
+    finish_figure(str(strategy) + '_robot', headless)
 
 # Run the main function
 if __name__ == "__main__":
-    main()
+    args = parse_plot_args()
+    main(plots=not args.no_plots, headless=args.headless)
@@ -0,0 +1,194 @@
+import multiprocessing
+import random
+import time
+from multiprocessing import shared_memory
+import numpy as np
+from tileworld import Robot, TileWorld
+from tileworld.noise_rng import BlockRNG
+from tileworld.trajectory import ArrayTrajectory
+from tileworld.uncertainty_table import get_table
+from tileworld.world_model import WorldModel
+
+# Fleet mode: several beta distribution robots, each in its own process, map
+# one TileWorld together. All black/white counts live in one shared memory
+# table laid out like world_model.new_counts(), so a robot reads the fleet-wide
+# counts of a tile with two memoryview lookups, the same cost as its own counts.
+# Increments are guarded by striped locks (tile p uses lock p % stripes), so
+# robots on different tiles rarely wait for each other; reads take no lock. The
+# world is a hashed TileWorld, so every process rebuilds it from the seed
+# instead of receiving it.
+
+# Strategies that only read counts through calculate_uncertainty() or robot.counts; the
+# others read a per-robot posterior, which fleet robots do not have
+FLEET_STRATEGIES = ('cautious', 'adventurous', 'general', 'lookahead')
+
+
+def check_fleet_strategy(strategy):
+    if strategy not in FLEET_STRATEGIES:
+        raise ValueError(f"Strategy {strategy!r} is not supported for fleet robots. Choose one of: {', '.join(FLEET_STRATEGIES)}.")
+
+class FleetCounts:
+    def __init__(self, length, name=None, locks=None, stripes=64):
+        self.length = length
+        size = length * 2 * 4
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.counts = self.shm.buf[:size].cast('I')  # Flat [black_count, white_count, ...] per tile
+        if name is None:
+            memoryview(self.counts).cast('B')[:] = bytes(size)
+        self.locks = locks if locks is not None else [multiprocessing.Lock() for _ in range(stripes)]
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def tile_counts(self, position):
+        # Fleet-wide (black_count, white_count) of one tile
+        counts = self.counts
+        return counts[2 * position], counts[2 * position + 1]
+
+    def add(self, position, color):
+        # Count one reading of `color` at `position`
+        with self.locks[position % len(self.locks)]:
+            self.counts[2 * position + color] += 1
+
+    def totals(self):
+        # (L, 2) copy of the fleet-wide counts
+        return np.frombuffer(self.counts, dtype=np.uint32).reshape(-1, 2).copy()
+
+    def close(self):
+        self.counts.release()
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+
+class FleetRobot(Robot):
+    # A robot that senses into the fleet's shared counts and bases every decision on them.
+    # It keeps no counts or posterior of its own, so it does not call Robot.__init__, which
+    # would allocate both, and snapshots, forks, resets and checkpoints are not supported
+    __slots__ = ('fleet',)
+
+    def __init__(self, world, fleet, trajectory=None, seed=None, strategy='cautious'):
+        check_fleet_strategy(strategy)
+        self.world = world
+        if seed is None:
+            self.position = random.randint(0, world.length - 1)
+        else:
+            self.position = int(np.random.default_rng(seed).integers(world.length))  # Same start as Robot
+        self.rng = BlockRNG(seed)
+        self.fleet = fleet
+        self.counts = fleet.counts
+        self.world_model = WorldModel(self.counts)
+        self.model = 'beta'
+        self.posterior = None
+        self.uncertainty_index = None
+        self.neighbour_field = None
+        self.history = trajectory if trajectory is not None else ArrayTrajectory()
+        self.noise_level = 0.0
+        self.strategy = strategy
+        self.initial_exploration_steps = 0
+        self.exploration_phase = False
+        self.exploration_steps = 0
+
+    def sense(self):
+        # Simulate perception, flipping the colour with probability equal to the noise level
+        position = self.position
+        perceived_color = self.world.tiles[position]
+        if self.noise_level and self.rng.random() < self.noise_level:
+            perceived_color = 1 - perceived_color
+
+        self.fleet.add(position, perceived_color)
+        self.history.append(position)
+        return perceived_color
+
+    def predict_color(self, position):
+        black_count, white_count = self.fleet.tile_counts(position)
+        total_count = black_count + white_count
+        if total_count == 0:
+            return 0.5  # Initial prediction when no data
+        return white_count / total_count
+
+    def tile_variance(self, position):
+        # Beta variance of the fleet-wide counts
+        return get_table('beta').value(*self.fleet.tile_counts(position))
+
+    def calculate_uncertainty(self, position):
+        if position < 0 or position >= self.world.length:
+            return float('inf')  # High uncertainty if out of bounds
+        return get_table('beta').value(*self.fleet.tile_counts(position))
+
+    def run(self, steps, strategy=None, stop=None, profiler=None, observers=None):
+        # Stop criteria keep running totals of the calling robot's own updates and never hear about
+        # the other robots' readings, so they would not track the fleet's map
+        if stop is not None:
+            raise ValueError("Stop criteria are not supported for fleet robots; check fleet.totals() between runs instead.")
+        check_fleet_strategy(strategy or self.strategy)
+        return super().run(steps, strategy, None, profiler, observers)
+
+    def _unsupported(self, *args, **kwargs):
+        raise NotImplementedError("Fleet robots keep no state of their own to snapshot, restore, fork or reset; "
+                                  "the map is the fleet's shared counts.")
+
+    snapshot = restore = fork = reset = set_neighbour_kernel = _unsupported
+
+
+def _fleet_worker(name, locks, world_length, world_seed, steps, strategy, noise_level, seed):
+    fleet = FleetCounts(world_length, name=name, locks=locks)
+    try:
+        robot = FleetRobot(TileWorld(world_length, 'hash', seed=world_seed), fleet, seed=seed)
+        robot.set_noise_level(noise_level)
+        robot.run(steps, strategy)
+        robot.world_model = robot.counts = None
+    finally:
+        fleet.close()
+
+
+def run_fleet(world_length, num_robots, steps, strategy='adventurous', noise_level=0.0, world_seed=0, seed=None):
+    # Run num_robots robots in separate processes for `steps` steps each; returns
+    # the fleet-wide (black_count, white_count) per tile and the world
+    check_fleet_strategy(strategy)  # Before any process starts, a worker would only report an exit code
+    fleet = FleetCounts(world_length)
+    seeds = np.random.SeedSequence(seed).generate_state(num_robots, dtype=np.uint64).tolist()
+    try:
+        processes = [
+            multiprocessing.Process(target=_fleet_worker, args=(fleet.name, fleet.locks, world_length, world_seed,
+                                                                steps, strategy, noise_level, seeds[index]))
+            for index in range(num_robots)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            if process.exitcode != 0:
+                raise RuntimeError(f"Fleet worker exited with code {process.exitcode}")
+        totals = fleet.totals()
+    finally:
+        fleet.close()
+        fleet.unlink()
+    return totals, TileWorld(world_length, 'hash', seed=world_seed)
+
+
+def main():
+    # Parameters
+    world_length = 2000
+    steps = 20000
+    noise_level = 0.1
+
+    for num_robots in [1, 4]:
+        start = time.perf_counter()
+        totals, world = run_fleet(world_length, num_robots, steps // num_robots, 'adventurous', noise_level, world_seed=1)
+        elapsed = time.perf_counter() - start
+
+        tiles = world.tiles.to_array()
+        visited = totals.sum(axis=1) > 0
+        correct = (totals[:, 1] > totals[:, 0]) == (tiles == 1)
+        print(f"{num_robots} robot(s), {steps} steps in total: {elapsed:.2f} s, "
+              f"{visited.mean():.1%} of tiles visited, {correct[visited].mean():.1%} of visited tiles predicted correctly")
+
+# Run the main function
+if __name__ == "__main__":
+    main()
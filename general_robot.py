@@ -1,96 +1,15 @@
-import random
-import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
-
-class TileWorld:
-    def __init__(self, length):
-        #Initialize the world with random black(0) and white(1) tiles
-        self.tiles = [random.choice([0,1]) for _ in range(length)]
-        self.length = length
-
-
-class Robot:
-    def __init__(self, world):
-        self.world = world
-        self.position = random.randint(0, self.world.length - 1)
-        self.world_model = {}
-        for i in range(self.world.length):
-            self.world_model[i] = [0,0] # Histogram: [black_count, white_count]
-        self.history = []
-        self.exploration_phase = True
-        self.exploration_steps = 30
-
-    def sense(self):
-        current_tile = self.world.tiles[self.position]
-        self.world_model[self.position][current_tile] += 1
-        self.history.append(self.position)
-
-    def predict_color(self, position):
-        counts = self.world_model[position]
-        total_counts = sum(counts)
-        if total_counts == 0:
-            return 0.5 # Equal probability if no data
-        else:
-            p = counts[1] / total_counts #probability of the tile being white
-            return p
-    
+from plotting import density_grid, finish_figure, get_pyplot, normal_densities, parse_plot_args, plot_densities
+from tileworld import Robot as CoreRobot, TileWorld
 
-    def choose_action(self):
-        # Exploration phase to encourage visiting new positions
-        if self.exploration_phase:
-            if self.exploration_steps > 0:
-                self.exploration_steps -= 1
-                return random.choice([-1, 1])
-            else:
-                self.exploration_phase = False
-
-        if self.position == 0:
-            return 1 # Move right if at the left edge
-        elif self.position == self.world.length - 1:
-            return -1 # Move left if at the right edge
-
-        left_counts = self.world_model[self.position -1]
-        right_counts = self.world_model[self.position +1]
-
-        # Certainty is the maximum count divided by the total counts at the position
-        if sum(left_counts) > 0:
-            left_certainty = max(left_counts) / sum(left_counts)
-        else:
-            left_certainty = 0.5 #Default certainty if no data
-        
-        if sum(right_counts) > 0:
-            right_certainty = max(right_counts) / sum(right_counts)
-        else:
-            right_certainty = 0.5
-        
-        # Choose the direction with higher certainty
-        if left_certainty > right_certainty:
-            return -1 # Move elft
-        if right_certainty > left_certainty:
-            return 1 # Move right
-        else:
-            return random.choice([-1,1]) # Random choice if certainty is equal
-        
-    
-    def move(self, action):
-        self.position += action
-        self.position = max(0, min(self.position, self.world.length - 1))
-
-    def run(self, steps):
-        for _ in range(steps):
-            self.sense()
-            action = self.choose_action()
-            self.move(action)
-
-    @staticmethod
-    def generate_samples(mean, variance, size=1000):
-        if variance == 0:
-            variance = 0.0001  # Set a small variance if it is zero
-        stddev = np.sqrt(variance)
-        return np.random.normal(mean, stddev, size)
-
-def main():
+class Robot(CoreRobot):
+    # Noise-free robot: 30 random exploration steps, then it moves towards the more certain neighbour
+    __slots__ = ()
+
+    def __init__(self, world, trajectory=None, seed=None):
+        super().__init__(world, trajectory, seed, model='binomial', strategy='general', exploration_steps=30)
+
+def main(plots=True, headless=False):
     # Parameters
     world_length = 6
     steps = 100
@@ -104,7 +23,7 @@ def main():
     print("Running the simulation ... ")
 
     print("World Tiles:", world.tiles)
-    print("Robot History:", robot.history)
+    print("Robot History:", list(robot.history))
     print("World Model:")
     
     for pos, hist in robot.world_model.items():
@@ -115,19 +34,18 @@ def main():
     means = []
     variances = []
     for pos in range(world_length):
-        black_count, white_count = robot.world_model[pos]
-        total_count = black_count + white_count
-        if total_count == 0:
-            mean = 0.5
-            variance = 0.25
-        else:
-            mean = white_count / total_count
-            variance = mean * (1 - mean) / total_count
+        mean = robot.predict_color(pos)
+        variance = robot.tile_variance(pos)
         means.append(mean)
         variances.append(variance)
         print(f"Position {pos}: Mean = {mean:.3f}, Variance = {variance:.3f}")
 
 
+    if not plots:
+        return
+
+    plt = get_pyplot(headless)
+
     # Create subplots
     fig, axes = plt.subplots(1, 2, figsize=(16, 6))
 
@@ -149,29 +67,25 @@ def main():
     ax.legend()
 
     #====== Plot the distribution of mean predictions across tile indices =====#
-    # Generate sample data for KDE plots
-    samples = [Robot.generate_samples(mean, var) for mean, var in zip(means, variances)]
     ax = axes[1]
 
-    # Plotting KDE for each tile index
-    for index, sample in enumerate(samples):
-        sns.kdeplot(sample, label=f'Tile {index}', linewidth=2)
+    # Gaussian approximation of each tile's posterior, evaluated on a fixed grid
+    grid = density_grid()
+    plot_densities(ax, grid, normal_densities(means, variances, grid))
 
     ax.set_xlabel('Mean Prediction')
     ax.set_ylabel('Density')
     ax.set_title('Distribution of Mean Predictions for Each Tile Index', fontsize=16, fontweight='bold')
-    ax.legend()
 
     # Set x-axis limits
     ax.set_xlim(-0.5, 1.5)
 
-    plt.savefig('general_robot')
-    plt.tight_layout()
-    plt.show()
+    finish_figure('general_robot', headless)
 
 # Run the main function
 if __name__ == "__main__":
-    main()
+    args = parse_plot_args()
+    main(plots=not args.no_plots, headless=args.headless)
 
 
 
@@ -0,0 +1,110 @@
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from batch_simulator import BatchSimulator
+from tileworld.sequential import Welford
+
+# Parameter sweep over noise level, strategy, world length and step count.
+# Every configuration is replicated over many seeds; the replicates are split
+# into chunks, and each chunk runs as one BatchSimulator in a worker process.
+# A chunk reports (count, mean, sum of squared deviations) per metric, and the
+# chunks are merged with the parallel Welford update, so the standard deviation
+# does not suffer from the cancellation of E[x^2] - E[x]^2.
+
+METRICS = ['posterior_error', 'coverage', 'convergence_step']
+
+
+def make_grid(noise_levels=(0.0, 0.1, 0.4), strategies=('cautious', 'adventurous'), world_lengths=(6,), steps=(40,)):
+    return [
+        {'noise_level': noise_level, 'strategy': strategy, 'world_length': world_length, 'steps': num_steps}
+        for noise_level, strategy, world_length, num_steps in itertools.product(noise_levels, strategies, world_lengths, steps)
+    ]
+
+
+def moments(values):
+    # (count, mean, sum of squared deviations from the mean) of one chunk's values
+    if len(values) == 0:
+        return 0, 0.0, 0.0
+    mean = values.mean()
+    return len(values), float(mean), float(np.square(values - mean).sum())
+
+
+def run_chunk(config, num_replicates, seed):
+    # Run one chunk of replicates of a configuration and return the moments of every metric
+    simulator = BatchSimulator(num_replicates, config['world_length'], noise_level=config['noise_level'],
+                               strategy=config['strategy'], seed=seed)
+    simulator.run(config['steps'])
+
+    posterior_error = np.abs(simulator.posterior_means() - simulator.tiles).mean(axis=1)
+    coverage = (simulator.counts.sum(axis=2) > 0).mean(axis=1)
+    converged = simulator.converged_at >= 0
+    convergence_step = simulator.converged_at[converged].astype(float)
+
+    return {
+        'replicates': num_replicates,
+        'converged': int(converged.sum()),
+        'moments': {
+            'posterior_error': moments(posterior_error),
+            'coverage': moments(coverage),
+            'convergence_step': moments(convergence_step),
+        },
+    }
+
+
+def summarize(total):
+    # Turn merged chunk results into per-configuration means and (population) standard deviations
+    summary = {'replicates': total['replicates'], 'converged_fraction': total['converged'] / total['replicates']}
+    for metric in METRICS:
+        accumulator = total['accumulators'][metric]
+        if accumulator.count == 0:
+            summary[metric] = {'mean': float('nan'), 'std': float('nan')}
+            continue
+        summary[metric] = {'mean': float(accumulator.mean), 'std': float(np.sqrt(accumulator.m2 / accumulator.count))}
+    return summary
+
+
+def run_sweep(grid, replicates=1000, chunk_size=1000, seed=0, max_workers=None):
+    # Split every configuration into chunks of replicates with independent seeds
+    seeds = np.random.SeedSequence(seed)
+    units = []
+    for index, config in enumerate(grid):
+        config_seeds = seeds.spawn(1)[0]
+        for start in range(0, replicates, chunk_size):
+            units.append((index, config, min(chunk_size, replicates - start), config_seeds.spawn(1)[0]))
+
+    totals = [{'replicates': 0, 'converged': 0, 'accumulators': {metric: Welford() for metric in METRICS}} for _ in grid]
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = {executor.submit(run_chunk, config, size, unit_seed): index for index, config, size, unit_seed in units}
+        for future in as_completed(futures):
+            index = futures[future]
+            chunk = future.result()
+            total = totals[index]
+            total['replicates'] += chunk['replicates']
+            total['converged'] += chunk['converged']
+            for metric in METRICS:
+                total['accumulators'][metric].merge(*chunk['moments'][metric])
+
+    return [dict(config, **summarize(total)) for config, total in zip(grid, totals)]
+
+
+def main():
+    # Parameters
+    grid = make_grid(world_lengths=(6, 20), steps=(40, 100))
+    replicates = 10000
+
+    print(f"Sweeping {len(grid)} configurations x {replicates} replicates on {os.cpu_count()} cores ... ")
+    start = time.perf_counter()
+    results = run_sweep(grid, replicates=replicates)
+    print(f"Done in {time.perf_counter() - start:.1f} s\n")
+
+    print(f"{'noise':>6} {'strategy':>12} {'length':>6} {'steps':>6} {'error':>7} {'coverage':>9} {'converged':>10} {'conv. step':>11}")
+    for result in results:
+        print(f"{result['noise_level']:>6} {result['strategy']:>12} {result['world_length']:>6} {result['steps']:>6} "
+              f"{result['posterior_error']['mean']:>7.3f} {result['coverage']['mean']:>9.3f} "
+              f"{result['converged_fraction']:>10.3f} {result['convergence_step']['mean']:>11.1f}")
+
+# Run the main function
+if __name__ == "__main__":
+    main()
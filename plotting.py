@@ -0,0 +1,66 @@
+import argparse
+import numpy as np
+
+# Lazy plotting helpers shared by the robot scripts.
+# matplotlib is only imported the first time a figure is requested, so runs
+# without plots never pay its import cost. In headless mode the Agg backend is
+# selected and figures are written straight to disk instead of opening a window.
+
+_pyplot = None
+
+
+def get_pyplot(headless=False):
+    global _pyplot
+    if _pyplot is None:
+        import matplotlib
+        if headless:
+            matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        _pyplot = plt
+    return _pyplot
+
+
+def finish_figure(path, headless=False):
+    # Save the current figure, then show it or (headless) close it
+    plt = get_pyplot(headless)
+    plt.tight_layout()
+    plt.savefig(path)
+    if headless:
+        plt.close()
+    else:
+        plt.show()
+
+
+def parse_plot_args(description=None):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--headless', action='store_true', help='use the Agg backend and only save figures to disk')
+    parser.add_argument('--no-plots', action='store_true', help='skip plotting entirely')
+    return parser.parse_args()
+
+
+def density_grid(low=-0.5, high=1.5, points=801):
+    return np.linspace(low, high, points)
+
+
+def normal_densities(means, variances, grid):
+    # Gaussian approximation of every tile's posterior on the grid, one row per tile
+    means = np.asarray(means, dtype=float)[:, None]
+    variances = np.asarray(variances, dtype=float)[:, None]
+    variances = np.where(variances == 0, 0.0001, variances)  # Set a small variance if it is zero
+    return np.exp(-0.5 * (grid - means) ** 2 / variances) / np.sqrt(2 * np.pi * variances)
+
+
+def beta_densities(alpha, beta, grid):
+    # Beta(alpha, beta) pdf of every tile on the grid, one row per tile
+    from scipy.stats import beta as beta_distribution
+    return beta_distribution.pdf(grid, np.asarray(alpha, dtype=float)[:, None], np.asarray(beta, dtype=float)[:, None])
+
+
+def plot_densities(ax, grid, densities, max_legend=20):
+    # Draw all tiles' density curves in one call; the legend is skipped for large worlds
+    lines = ax.plot(grid, densities.T, linewidth=2)
+    if len(lines) <= max_legend:
+        for index, line in enumerate(lines):
+            line.set_label(f'Tile {index}')
+        ax.legend()
+    return lines
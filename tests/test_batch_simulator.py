@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from batch_simulator import BatchSimulator
+from tileworld import Robot, TileWorld
+
+TILES = [0, 0, 1, 0, 1, 1]
+STEPS = 40
+
+
+def assert_means_agree(batch_values, scalar_values):
+    # Per-tile means agree within five standard errors of their difference
+    difference = batch_values.mean(axis=0) - scalar_values.mean(axis=0)
+    standard_error = np.sqrt(batch_values.var(axis=0) / len(batch_values) + scalar_values.var(axis=0) / len(scalar_values))
+    assert np.all(np.abs(difference) <= 5 * standard_error + 1e-9)
+
+
+@pytest.mark.parametrize('strategy', ['cautious', 'adventurous'])
+@pytest.mark.parametrize('noise_level', [0.0, 0.1, 0.4])
+def test_matches_scalar_robot(strategy, noise_level):
+    # Same sense/strategy/move semantics as Robot: per-tile visits and final variances agree
+    # within sampling error on a fixed world (the variances tell the two strategies apart)
+    simulator = BatchSimulator(4000, len(TILES), noise_level=noise_level, strategy=strategy, seed=1, tiles=TILES)
+    simulator.run(STEPS)
+
+    world = TileWorld(len(TILES))
+    world.tiles = list(TILES)
+    scalar_counts = []
+    for seed in range(500):
+        robot = Robot(world, seed=seed, noise_level=noise_level)
+        robot.run(STEPS, strategy)
+        scalar_counts.append(np.frombuffer(robot.counts, dtype=np.uint32).reshape(-1, 2).astype(np.int32))
+    scalar_counts = np.array(scalar_counts)
+
+    assert_means_agree(simulator.counts.sum(axis=2), scalar_counts.sum(axis=2))
+    assert_means_agree(simulator.variances(), BatchSimulator.uncertainty(scalar_counts[:, :, 0], scalar_counts[:, :, 1]))
+
+
+def test_converged_at_is_first_step_with_every_majority_correct():
+    simulator = BatchSimulator(300, 5, noise_level=0.3, strategy='adventurous', seed=2)
+    first_correct = np.full(300, -1)
+    for step in range(1, 61):
+        simulator.run(1)
+        majority = np.sign(simulator.counts[:, :, 1] - simulator.counts[:, :, 0])
+        correct = majority == simulator.tiles * 2 - 1
+        assert np.array_equal(simulator.num_correct, correct.sum(axis=1))
+        first_correct[(first_correct < 0) & correct.all(axis=1)] = step
+    assert np.array_equal(simulator.converged_at, first_correct)
+    assert (simulator.converged_at > 0).any() and (simulator.converged_at < 0).any()
+
+
+def test_converged_at_without_noise_is_when_every_tile_was_seen():
+    simulator = BatchSimulator(1, 3, strategy='adventurous', seed=0, tiles=[1, 0, 1])
+    simulator.positions[:] = 0
+    seen = set()
+    step = 0
+    while len(seen) < 3 and step < 100:
+        seen.add(int(simulator.positions[0]))
+        simulator.run(1)
+        step += 1
+    assert simulator.converged_at[0] == step
@@ -0,0 +1,48 @@
+import pytest
+from tileworld import Robot, TileWorld
+from tileworld.checkpoint import load_checkpoint, resume, run_with_checkpoints
+
+
+def make_robot(strategy, separate_streams=False, seed=7):
+    return Robot(TileWorld(40, seed=1), seed=seed, noise_level=0.1, strategy=strategy, separate_streams=separate_streams)
+
+
+def state(robot):
+    return list(robot.counts), robot.position, robot.rng.get_state()
+
+
+@pytest.mark.parametrize('strategy', ['cautious', 'adventurous', 'general', 'neighbour_adventurous'])
+def test_repeated_preemption_matches_uninterrupted_run(tmp_path, strategy):
+    path = str(tmp_path / 'robot.ck')
+    uninterrupted = make_robot(strategy)
+    uninterrupted.run(300)
+
+    robot = make_robot(strategy)
+    run_with_checkpoints(robot, 10, path, strategy, check_every=10)
+    for steps in range(20, 301, 10):
+        # Every chunk runs in a fresh robot that only knows the checkpoint
+        robot = make_robot(strategy, seed=99)
+        resume(robot, steps, path, check_every=10)
+    assert state(robot) == state(uninterrupted)
+
+
+def test_resume_with_no_steps_left_keeps_the_checkpoint(tmp_path):
+    path = str(tmp_path / 'robot.ck')
+    uninterrupted = make_robot('adventurous')
+    uninterrupted.run(3000)
+
+    run_with_checkpoints(make_robot('adventurous'), 1000, path, 'adventurous')
+    resume(make_robot('adventurous', seed=99), 1000, path)
+    robot = make_robot('adventurous', seed=99)
+    resume(robot, 3000, path)
+    assert state(robot) == state(uninterrupted)
+
+
+def test_stream_count_mismatch_leaves_robot_unchanged(tmp_path):
+    path = str(tmp_path / 'robot.ck')
+    run_with_checkpoints(make_robot('cautious'), 50, path)
+    robot = make_robot('cautious', separate_streams=True, seed=99)
+    before = state(robot)
+    with pytest.raises(ValueError, match='random streams'):
+        load_checkpoint(path, robot)
+    assert state(robot) == before
@@ -0,0 +1,73 @@
+import pytest
+from fleet import FleetCounts, FleetRobot, run_fleet
+from tileworld import TileWorld
+from tileworld.stopping import MeanVarianceBelow
+
+
+@pytest.fixture
+def fleet():
+    fleet = FleetCounts(50)
+    yield fleet
+    fleet.close()
+    fleet.unlink()
+
+
+def make_robots(fleet, count):
+    world = TileWorld(50, 'hash', seed=1)
+    return [FleetRobot(world, fleet, seed=seed) for seed in range(count)]
+
+
+def test_robots_share_one_count_table(fleet):
+    robots = make_robots(fleet, 4)
+    for robot in robots:
+        robot.set_noise_level(0.1)
+        robot.run(300, 'adventurous')
+    totals = fleet.totals()
+    assert totals.sum() == 4 * 300
+    for position in range(50):
+        visits = sum(list(robot.history).count(position) for robot in robots)
+        assert totals[position].sum() == visits
+    # Every robot's decisions read the fleet-wide counts, not its own readings
+    black_count, white_count = fleet.tile_counts(robots[0].position)
+    assert robots[1].tile_variance(robots[0].position) == robots[0].tile_variance(robots[0].position)
+    assert black_count + white_count >= 1
+
+
+def test_stop_criteria_are_rejected(fleet):
+    robot = make_robots(fleet, 1)[0]
+    with pytest.raises(ValueError, match='Stop criteria'):
+        robot.run(100, 'adventurous', stop=MeanVarianceBelow(0.1))
+
+
+def test_run_fleet_counts_every_step():
+    totals, world = run_fleet(40, 3, 200, 'cautious', noise_level=0.1, world_seed=2, seed=0)
+    assert totals.shape == (40, 2)
+    assert totals.sum() == 3 * 200
+
+
+@pytest.mark.parametrize('strategy', ['cautious', 'adventurous', 'general', 'lookahead'])
+def test_supported_strategies_run(fleet, strategy):
+    robot = make_robots(fleet, 1)[0]
+    robot.run(100, strategy)
+    assert fleet.totals().sum() == 100
+
+
+@pytest.mark.parametrize('strategy', ['adventurous_global', 'neighbour_cautious', 'neighbour_adventurous'])
+def test_posterior_strategies_are_rejected(fleet, strategy):
+    robot = make_robots(fleet, 1)[0]
+    with pytest.raises(ValueError, match='not supported for fleet robots'):
+        robot.run(10, strategy)
+    with pytest.raises(ValueError, match='not supported for fleet robots'):
+        run_fleet(20, 2, 10, strategy)
+
+
+def test_robot_state_operations_are_rejected(fleet, tmp_path):
+    from tileworld.checkpoint import load_checkpoint, save_checkpoint
+    robot = make_robots(fleet, 1)[0]
+    for operation in (robot.snapshot, robot.fork, robot.reset):
+        with pytest.raises(NotImplementedError):
+            operation()
+    with pytest.raises(ValueError, match='cannot be checkpointed'):
+        save_checkpoint(str(tmp_path / 'fleet.ck'), robot, 0)
+    with pytest.raises(ValueError, match='cannot be checkpointed'):
+        load_checkpoint(str(tmp_path / 'fleet.ck'), robot)
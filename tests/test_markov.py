@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from tileworld import Robot, TileWorld, register_strategy
+from tileworld.markov import POSITION_POLICIES, evaluate, right_probabilities, transition_matrix
+
+right = right_probabilities('reflecting', 6)
+
+
+@register_strategy('test_reflecting')
+def reflecting_strategy(robot):
+    return 1 if robot.rng.random() < right[robot.position] else -1
+
+
+def test_evaluate_matches_monte_carlo():
+    world = TileWorld(6, seed=1)
+    steps, noise_level, runs = 30, 0.1, 400
+    exact = evaluate(world, 'reflecting', steps, noise_level)
+
+    visits, variances = [], []
+    for seed in range(runs):
+        robot = Robot(world, seed=seed, noise_level=noise_level, strategy='test_reflecting')
+        robot.run(steps)
+        visits.append(np.frombuffer(robot.counts, dtype=np.uint32).reshape(-1, 2).sum(axis=1))
+        variances.append(robot.posterior.all_tiles()['variance'].copy())
+    for exact_values, samples in ((exact.expected_visits, np.array(visits)), (exact.expected_variance, np.array(variances))):
+        standard_error = samples.std(axis=0) / np.sqrt(runs)
+        assert np.all(np.abs(samples.mean(axis=0) - exact_values) <= 4 * standard_error + 1e-9)
+    assert exact.expected_visits.sum() == pytest.approx(steps)
+
+
+@pytest.mark.parametrize('policy', list(POSITION_POLICIES) + [np.linspace(0, 1, 7)])
+@pytest.mark.parametrize('noise_level', [0.0, 0.1, 0.5])
+def test_transition_rows_sum_to_one(policy, noise_level):
+    P = transition_matrix(right_probabilities(policy, 7), noise_level)
+    assert np.allclose(P.sum(axis=1), 1.0)
+    assert np.all(P >= 0)
+    # Edges: only the edge itself and its one neighbour are reachable
+    assert np.count_nonzero(P[0, 2:]) == 0 and np.count_nonzero(P[-1, :-2]) == 0
@@ -0,0 +1,44 @@
+import pytest
+from tileworld import Robot, TileWorld
+from tileworld.noise_rng import BlockRNG
+
+
+def used_counts(rng_state):
+    return [used for _, used in rng_state]
+
+
+def test_set_state_round_trip_before_drawing():
+    rng = BlockRNG(seed=1, separate_actuator=True)
+    for _ in range(10):
+        rng.random()
+    rng.sign()
+    state = rng.get_state()
+    rng.set_state(state)
+    assert used_counts(rng.get_state()) == used_counts(state) == [10, 1, 0]
+    assert rng.get_state() == state
+
+
+def test_restored_rng_continues_the_stream():
+    rng = BlockRNG(seed=2)
+    values = [rng.random() for _ in range(5000)]  # Crosses a block boundary
+    restored = BlockRNG(seed=3)
+    rng = BlockRNG(seed=2)
+    for _ in range(100):
+        rng.random()
+    restored.set_state(rng.get_state())
+    assert [restored.random() for _ in range(4900)] == values[100:]
+
+
+@pytest.mark.parametrize('strategy', ['cautious', 'adventurous', 'general', 'neighbour_adventurous', 'lookahead'])
+def test_snapshot_restore_snapshot(strategy):
+    robot = Robot(TileWorld(30, seed=3), seed=7, noise_level=0.1, strategy=strategy)
+    robot.run(57)
+    snapshot = robot.snapshot()
+    robot.restore(snapshot)
+    assert robot.snapshot().rng_state == snapshot.rng_state
+
+    fork = robot.fork()
+    fork.run(300)
+    robot.run(300)
+    assert list(fork.counts) == list(robot.counts)
+    assert fork.position == robot.position
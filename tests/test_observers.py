@@ -0,0 +1,20 @@
+import tileworld.robot
+from tileworld import Robot, TileWorld
+from tileworld.observers import CallbackObserver
+
+
+def test_observed_run_matches_plain_run_and_resolves_strategy_once(monkeypatch):
+    world = TileWorld(100, 'hash', seed=1)
+    plain = Robot(world, seed=3, noise_level=0.1)
+    plain.run(1000, 'adventurous')
+
+    observed = Robot(world, seed=3, noise_level=0.1)
+    calls = []
+    lookup = tileworld.robot.get_strategy
+    monkeypatch.setattr(tileworld.robot, 'get_strategy', lambda name: calls.append(name) or lookup(name))
+    steps = []
+    observer = CallbackObserver(on_step=lambda step, position, color, action: steps.append(position))
+    assert observed.run(1000, 'adventurous', observers=[observer]) == 1000
+    assert calls == ['adventurous']
+    assert list(observed.counts) == list(plain.counts)
+    assert steps == list(plain.history)
@@ -0,0 +1,29 @@
+import tileworld.robot
+from tileworld import Robot, TileWorld
+from tileworld.profiling import PhaseProfiler
+
+
+def counting_lookups(monkeypatch):
+    calls = []
+    lookup = tileworld.robot.get_strategy
+
+    def get_strategy(name):
+        calls.append(name)
+        return lookup(name)
+
+    monkeypatch.setattr(tileworld.robot, 'get_strategy', get_strategy)
+    return calls
+
+
+def test_profiled_run_matches_plain_run_and_resolves_strategy_once(monkeypatch):
+    world = TileWorld(100, 'hash', seed=1)
+    plain = Robot(world, seed=3, noise_level=0.1)
+    plain.run(2000, 'adventurous')
+
+    profiler = PhaseProfiler(sample_every=3)
+    profiled = Robot(world, seed=3, noise_level=0.1)
+    calls = counting_lookups(monkeypatch)
+    assert profiled.run(2000, 'adventurous', profiler=profiler) == 2000
+    assert calls == ['adventurous']
+    assert list(profiled.counts) == list(plain.counts)
+    assert profiler.calls['choose_action[adventurous]'] == 667
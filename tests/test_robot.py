@@ -0,0 +1,44 @@
+import random
+from tileworld import Robot, TileWorld
+
+
+def test_seed_reproduces_the_run():
+    world = TileWorld(50, seed=1)
+    runs = []
+    for global_seed in range(5):
+        random.seed(global_seed)  # The global random state must not matter for a seeded robot
+        robot = Robot(world, seed=7, noise_level=0.1)
+        robot.run(200)
+        runs.append((list(robot.history), list(robot.counts)))
+    assert all(run == runs[0] for run in runs)
+
+
+def test_seed_chooses_the_start_position():
+    world = TileWorld(1000, seed=1)
+    positions = {Robot(world, seed=seed).position for seed in range(20)}
+    assert len(positions) > 1
+    assert all(0 <= position < 1000 for position in positions)
+
+
+def test_reset_starts_over():
+    from general_robot import Robot as GeneralRobot
+    world = TileWorld(50, seed=1)
+    robot = GeneralRobot(world, seed=3)
+    initial_steps = robot.exploration_steps
+    assert robot.exploration_phase and initial_steps > 0
+    robot.run(initial_steps + 20)
+    assert not robot.exploration_phase
+
+    robot.reset()
+    assert robot.exploration_phase and robot.exploration_steps == initial_steps
+    assert len(robot.history) == 0 and sum(robot.counts) == 0
+    robot.run(10)
+    assert len(robot.history) == 10
+
+
+def test_fork_keeps_the_exploration_length():
+    robot = Robot(TileWorld(20, seed=1), seed=1, strategy='general', exploration_steps=5)
+    robot.run(30)
+    fork = robot.fork()
+    fork.reset()
+    assert fork.exploration_phase and fork.exploration_steps == 5
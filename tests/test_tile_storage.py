@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+from tileworld import TileWorld
+from tileworld.tile_storage import PackedTiles
+
+
+@pytest.mark.parametrize('length', [0, 1, 8, 13, 1000])
+def test_packed_file_round_trip(tmp_path, length):
+    path = str(tmp_path / 'world.bin')
+    world = TileWorld(length, 'packed', seed=4, path=path)
+    shared = TileWorld(length, 'shared', path=path)
+    assert len(shared.tiles) == length
+    assert np.array_equal(shared.tiles.to_array(), world.tiles.to_array())
+
+
+def test_open_needs_the_length_and_rejects_short_files(tmp_path):
+    path = str(tmp_path / 'world.bin')
+    TileWorld(13, 'packed', seed=4, path=path)
+    with pytest.raises(TypeError):
+        PackedTiles.open(path)
+    with pytest.raises(ValueError):
+        PackedTiles.open(path, 17)
@@ -0,0 +1,3 @@
+from .robot import Robot, RobotSnapshot
+from .strategies import STRATEGIES, register_strategy
+from .world import TileWorld
@@ -0,0 +1,128 @@
+import os
+import struct
+import time
+
+# Compact binary checkpoints for long runs of any robot built on robot.py, so
+# a crashed or preempted run can resume exactly where it stopped.
+#
+# Layout (little endian):
+#   header   magic b'TWCK', version, number of RNG streams, world length, position,
+#            step, noise level, exploration phase and steps, strategy name length
+#   strategy UTF-8 name ('' for the robot's default strategy)
+#   rng      for each BlockRNG stream (two, or three with separate_streams): PCG64 state and increment
+#            (128 bit each), has_uint32, uinteger and values used in the block
+#   counts   the robot's flat uint32 [black, white, ...] counts array
+# The cached posterior is rebuilt from the counts on load.
+
+MAGIC = b'TWCK'
+VERSION = 2
+HEADER = struct.Struct('<4sHBQQQdBqH')
+RNG_STREAM = struct.Struct('<16s16sBII')
+
+
+def _pack_rng(rng_state):
+    data = b''
+    for block_state, used in rng_state:
+        pcg = block_state['state']
+        data += RNG_STREAM.pack(pcg['state'].to_bytes(16, 'little'), pcg['inc'].to_bytes(16, 'little'),
+                                block_state['has_uint32'], block_state['uinteger'], used)
+    return data
+
+
+def _unpack_rng(data, offset, streams):
+    rng_state = []
+    for _ in range(streams):
+        state, inc, has_uint32, uinteger, used = RNG_STREAM.unpack_from(data, offset)
+        offset += RNG_STREAM.size
+        block_state = {
+            'bit_generator': 'PCG64',
+            'state': {'state': int.from_bytes(state, 'little'), 'inc': int.from_bytes(inc, 'little')},
+            'has_uint32': has_uint32,
+            'uinteger': uinteger,
+        }
+        rng_state.append((block_state, used))
+    return tuple(rng_state), offset
+
+
+def _check_robot(robot):
+    if robot.posterior is None:
+        raise ValueError(f"{type(robot).__name__} keeps no counts of its own and cannot be checkpointed.")
+
+
+def save_checkpoint(path, robot, step, strategy=None):
+    _check_robot(robot)
+    strategy_name = (strategy or '').encode()
+    rng_state = robot.rng.get_state()
+    header = HEADER.pack(MAGIC, VERSION, len(rng_state), robot.world.length, robot.position, step, robot.noise_level,
+                         robot.exploration_phase, robot.exploration_steps, len(strategy_name))
+
+    # Write to a temporary file first so a crash mid-write never leaves a broken checkpoint
+    temporary_path = path + '.tmp'
+    with open(temporary_path, 'wb') as f:
+        f.write(header)
+        f.write(strategy_name)
+        f.write(_pack_rng(rng_state))
+        f.write(memoryview(robot.counts).cast('B'))
+    os.replace(temporary_path, path)
+
+
+def load_checkpoint(path, robot):
+    # Restore a checkpoint into `robot` (same class, world length and separate_streams); returns (step, strategy).
+    # Everything is checked before the robot is changed, so a rejected checkpoint leaves it untouched
+    _check_robot(robot)
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if len(data) < HEADER.size or data[:4] != MAGIC:
+        raise ValueError(f"{path} is not a robot checkpoint.")
+    (magic, version, streams, world_length, position, step, noise_level, exploration_phase, exploration_steps,
+     name_length) = HEADER.unpack_from(data)
+    if version != VERSION:
+        raise ValueError(f"{path} is a version {version} checkpoint, expected version {VERSION}.")
+    if world_length != robot.world.length:
+        raise ValueError(f"Checkpoint is for a world of length {world_length}, robot has {robot.world.length}.")
+    robot_streams = len(robot.rng.get_state())
+    if streams != robot_streams:
+        raise ValueError(f"Checkpoint has {streams} random streams, robot has {robot_streams} "
+                         f"(both must use the same separate_streams).")
+    offset = HEADER.size
+    strategy = data[offset:offset + name_length].decode() or None
+    offset += name_length
+    counts_size = len(memoryview(robot.counts).cast('B'))
+    if len(data) - offset != streams * RNG_STREAM.size + counts_size:
+        raise ValueError(f"{path} is truncated or does not match the robot's counts array.")
+    rng_state, offset = _unpack_rng(data, offset, streams)
+
+    robot.position = position
+    memoryview(robot.counts).cast('B')[:] = data[offset:]
+    robot.rng.set_state(rng_state)
+    robot.noise_level = noise_level
+    robot.exploration_phase = bool(exploration_phase)
+    robot.exploration_steps = exploration_steps
+    robot.posterior.load_counts(robot.counts)
+    robot.uncertainty_index = None  # Rebuilt on next use
+    if robot.neighbour_field is not None:
+        robot.neighbour_field.rebuild()
+    return step, strategy
+
+
+def run_with_checkpoints(robot, steps, path, strategy=None, interval=5.0, check_every=10000, start_step=0):
+    # Run until `steps` steps in total have been executed, checkpointing at most every `interval` seconds.
+    # The clock is only read every `check_every` steps, so the step loop itself is unchanged.
+    step = start_step
+    last_save = time.monotonic()
+    while step < steps:
+        chunk = min(check_every, steps - step)
+        robot.run(chunk, strategy)
+        step += chunk
+        if time.monotonic() - last_save >= interval:
+            save_checkpoint(path, robot, step, strategy)
+            last_save = time.monotonic()
+    save_checkpoint(path, robot, step, strategy)
+    return step
+
+
+def resume(robot, steps, path, interval=5.0, check_every=10000):
+    # Continue a run from its last checkpoint
+    step, strategy = load_checkpoint(path, robot)
+    return run_with_checkpoints(robot, steps, path, strategy, interval, check_every, start_step=step)
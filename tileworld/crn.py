@@ -0,0 +1,82 @@
+import time
+import numpy as np
+from .robot import Robot
+from .tile_storage import tiles_as_array
+from .world import TileWorld
+
+# Common random numbers for comparing robot configurations.
+#
+# In paired mode every configuration of a replicate runs in the same world from
+# the same start position, and the robot's sensor, actuator and tie-break
+# streams come from the same seed. The sensor and actuator get separate streams
+# (Robot(separate_streams=True)), so the k-th reading and the k-th move of every
+# configuration are flipped by the same uniform draw. That draw is compared with
+# the noise level, so noise 0.10 and noise 0.12 flip the same readings except
+# where the draw falls between the two levels. The per-replicate results of two
+# configurations are then strongly correlated, and their difference has a much
+# smaller variance than the difference of independent runs.
+#
+# A configuration is a dict of Robot keyword arguments, e.g.
+#   {'strategy': 'cautious', 'noise_level': 0.1}
+
+
+def final_error(robot):
+    # Mean absolute error of the predicted colour against the real tiles
+    tiles = tiles_as_array(robot.world.tiles)
+    return float(np.abs(robot.posterior.all_tiles()['prediction'] - tiles).mean())
+
+
+def final_variance(robot):
+    # Mean posterior variance over all tiles
+    return float(robot.posterior.all_tiles()['variance'].mean())
+
+
+def run_replicates(configs, world_length, steps, replicates, seed=0, paired=True, metric=final_error):
+    # Returns a (replicates, len(configs)) array of metric(robot) after `steps` steps;
+    # with paired=False every run gets its own world, start position and streams
+    sequence = np.random.SeedSequence(seed)
+    values = np.empty((replicates, len(configs)))
+    for replicate, replicate_sequence in enumerate(sequence.spawn(replicates)):
+        run_sequences = [replicate_sequence] * len(configs) if paired else replicate_sequence.spawn(len(configs))
+        for index, (config, run_sequence) in enumerate(zip(configs, run_sequences)):
+            world_seed, robot_seed = run_sequence.generate_state(2, dtype=np.uint64).tolist()
+            robot = Robot(TileWorld(world_length, seed=world_seed), seed=robot_seed, separate_streams=True, **config)
+            robot.run(steps)
+            values[replicate, index] = metric(robot)
+    return values
+
+
+def compare(values, baseline=0):
+    # For every configuration: (mean difference to the baseline column, standard error of that difference)
+    differences = values - values[:, [baseline]]
+    return differences.mean(axis=0), differences.std(axis=0, ddof=1) / np.sqrt(len(values))
+
+
+def main():
+    # Parameters
+    world_length = 6
+    steps = 40
+    replicates = 400
+    comparisons = {
+        'cautious vs adventurous (noise 0.1)': [{'strategy': 'cautious', 'noise_level': 0.1},
+                                                 {'strategy': 'adventurous', 'noise_level': 0.1}],
+        'noise 0.10 vs 0.12 (adventurous)': [{'strategy': 'adventurous', 'noise_level': 0.10},
+                                              {'strategy': 'adventurous', 'noise_level': 0.12}],
+    }
+
+    for name, configs in comparisons.items():
+        print(f"\n{name}, {replicates} replicates of {steps} steps:")
+        standard_errors = {}
+        for paired in [True, False]:
+            start = time.perf_counter()
+            difference, standard_error = compare(run_replicates(configs, world_length, steps, replicates, paired=paired))
+            standard_errors[paired] = standard_error[1]
+            mode = 'paired' if paired else 'independent'
+            print(f"  {mode:>11}: difference in final error {difference[1]:+.4f} +/- {1.96 * standard_error[1]:.4f} "
+                  f"({time.perf_counter() - start:.1f} s)")
+        ratio = (standard_errors[False] / standard_errors[True]) ** 2
+        print(f"  Independent runs need {ratio:.1f}x as many replicates for the same confidence interval")
+
+# Run the main function
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import random
+import time
+from collections import namedtuple
+import numpy as np
+from .tile_storage import tiles_as_array
+from .uncertainty_table import get_table
+
+# Exact evaluation of a robot whose move only depends on its position.
+# Such a policy and the noisy move() form a Markov chain over positions, so
+# instead of averaging many Monte Carlo runs, the distribution of the robot's
+# position is pushed through the transition matrix once per step. The number
+# of times each tile is sensed is tracked jointly with the position, which
+# gives each tile's exact visit-count distribution. With the sensor flip, that
+# gives the expected posterior variance after T steps as well.
+#
+# A policy is the probability of choosing a move to the right at each position:
+# a name from POSITION_POLICIES, a function(position, length) or a sequence.
+# The cost is O(L^3 T^2) for L tiles and T steps, so this is meant for small
+# worlds like the 6-tile worlds of the scripts.
+
+# Expected results of `steps` steps:
+#   occupancy           (T, L) probability of sensing tile j at step t
+#   expected_visits     (L,)   expected number of times each tile is sensed
+#   visit_distribution  (L, T + 1) probability that tile j is sensed exactly n times
+#   expected_variance   (L,)   expected posterior variance of each tile at the end
+MarkovEvaluation = namedtuple('MarkovEvaluation', ['occupancy', 'expected_visits', 'visit_distribution', 'expected_variance'])
+
+POSITION_POLICIES = {
+    # Exploration phase of the general robot: a random direction, also at the edges
+    'random': lambda position, length: 0.5,
+    # General robot after exploration in a noise-free world once every tile has been
+    # seen (all certainties are 1, so every choice is a tie): forced away from the edges
+    'reflecting': lambda position, length: 1.0 if position == 0 else 0.0 if position == length - 1 else 0.5,
+}
+
+
+def right_probabilities(policy, length):
+    # Probability of choosing a move to the right at every position
+    if isinstance(policy, str):
+        if policy not in POSITION_POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}. Choose one of: {', '.join(POSITION_POLICIES)}.")
+        policy = POSITION_POLICIES[policy]
+    if callable(policy):
+        return np.array([policy(position, length) for position in range(length)], dtype=float)
+    right = np.asarray(policy, dtype=float)
+    if right.shape != (length,):
+        raise ValueError(f"Policy must give one probability per tile ({length}), got shape {right.shape}.")
+    return right
+
+
+def transition_matrix(right_probability, noise_level=0.0):
+    # P[i, j]: probability of moving from position i to j, with the action flipped with probability noise_level
+    length = len(right_probability)
+    right = right_probability * (1 - noise_level) + (1 - right_probability) * noise_level
+    positions = np.arange(length)
+    P = np.zeros((length, length))
+    np.add.at(P, (positions, np.minimum(positions + 1, length - 1)), right)
+    np.add.at(P, (positions, np.maximum(positions - 1, 0)), 1 - right)
+    return P
+
+
+def observation_distribution(steps, white_probability):
+    # pmf[n, w]: probability of w white readings in n senses of one tile
+    pmf = np.zeros((steps + 1, steps + 1))
+    pmf[0, 0] = 1.0
+    for n in range(steps):
+        pmf[n + 1] = (1 - white_probability) * pmf[n]
+        pmf[n + 1, 1:] += white_probability * pmf[n, :-1]
+    return pmf
+
+
+def evaluate(world, policy, steps, noise_level=0.0, model='beta', start=None):
+    # Exact expectations of running a position-only policy for `steps` steps; the start position
+    # is uniform like Robot's unless `start` is given
+    length = world.length
+    tiles = tiles_as_array(world.tiles)
+    P = transition_matrix(right_probabilities(policy, length), noise_level)
+
+    distribution = np.full(length, 1 / length)
+    if start is not None:
+        distribution = np.zeros(length)
+        distribution[start] = 1.0
+
+    # joint[i, p, n]: probability that the robot is at p and has sensed tile i n times
+    joint = np.zeros((length, length, steps + 1))
+    joint[:, :, 0] = distribution
+    tile_index = np.arange(length)
+    occupancy = np.empty((steps, length))
+    for step in range(steps):
+        occupancy[step] = joint[0].sum(axis=1)
+        active = joint[:, :, :step + 2]  # No tile can have been sensed more than step + 1 times yet
+        # Sense: the robot at p senses tile p
+        active[tile_index, tile_index, 1:] = active[tile_index, tile_index, :-1]
+        active[tile_index, tile_index, 0] = 0.0
+        # Move: every tile's (position x count) slice goes through the transition matrix
+        active[:] = np.matmul(P.T, active)
+    visit_distribution = joint.sum(axis=1)
+
+    # Expected final variance given n senses, for black and white tiles (the sensor flips with probability noise_level)
+    n = np.arange(steps + 1)
+    white_counts = n[None, :]
+    black_counts = np.maximum(n[:, None] - white_counts, 0)
+    variances = get_table(model).values(black_counts, np.broadcast_to(white_counts, black_counts.shape))
+    variance_given_visits = {
+        color: (observation_distribution(steps, white_probability) * variances).sum(axis=1)
+        for color, white_probability in ((0, noise_level), (1, 1 - noise_level))
+    }
+    expected_variance = np.array([visit_distribution[i] @ variance_given_visits[int(tiles[i])] for i in range(length)])
+
+    return MarkovEvaluation(occupancy, occupancy.sum(axis=0), visit_distribution, expected_variance)
+
+
+def main():
+    from .robot import Robot
+    from .strategies import register_strategy
+    from .world import TileWorld
+
+    # Parameters
+    world_length = 6
+    steps = 100
+    noise_level = 0.1
+    runs = 20000
+
+    world = TileWorld(world_length, seed=1)
+    start = time.perf_counter()
+    exact = evaluate(world, 'reflecting', steps, noise_level)
+    exact_time = time.perf_counter() - start
+
+    right = right_probabilities('reflecting', world_length)
+
+    @register_strategy('reflecting')
+    def reflecting_strategy(robot):
+        return 1 if robot.rng.random() < right[robot.position] else -1
+
+    visits = np.zeros(world_length)
+    variances = np.zeros(world_length)
+    start = time.perf_counter()
+    for run in range(runs):
+        random.seed(run)
+        robot = Robot(world, seed=run, noise_level=noise_level, strategy='reflecting')
+        robot.run(steps)
+        visits += np.frombuffer(robot.counts, dtype=np.uint32).reshape(-1, 2).sum(axis=1)
+        variances += robot.posterior.all_tiles()['variance']
+    monte_carlo_time = time.perf_counter() - start
+
+    print("World Tiles:", world.tiles)
+    print(f"Exact: {exact_time * 1000:.1f} ms, Monte Carlo ({runs} runs): {monte_carlo_time:.1f} s")
+    for position in range(world_length):
+        print(f"Position {position}: visits {exact.expected_visits[position]:7.3f} exact, {visits[position] / runs:7.3f} MC; "
+              f"variance {exact.expected_variance[position]:.5f} exact, {variances[position] / runs:.5f} MC")
+
+# Run the main function
+if __name__ == "__main__":
+    main()
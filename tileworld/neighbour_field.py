@@ -0,0 +1,72 @@
+from array import array
+import numpy as np
+from .tile_storage import tiles_as_array
+from .uncertainty_table import get_table
+
+# Neighbour-weighted uncertainty used by the neighbour_cautious and
+# neighbour_adventurous strategies.
+#
+# Every tile q has a term u(q) = binomial variance * |tile - prediction|. The
+# score of moving left from p is the kernel-weighted sum of the terms around p,
+# by default 0.6 * u(p - 1) + 0.4 * u(p + 1); moving right uses the mirrored
+# kernel. The terms of the whole world are built once from the count arrays
+# and after each sense() only the sensed tile's term is recomputed. A decision
+# then reads len(kernel) cached terms instead of recomputing every neighbour's
+# statistics, and fields() gives both scores of every position as one weighted
+# convolution. The terms are zero-padded, so tiles outside the world count as 0.
+
+DEFAULT_KERNEL = ((-1, 0.6), (1, 0.4))  # (offset, weight) pairs of a move to the left
+
+
+class NeighbourField:
+    __slots__ = ('robot', 'variances', 'left_taps', 'right_taps', 'pad', 'terms')
+
+    def __init__(self, robot, kernel=DEFAULT_KERNEL):
+        self.robot = robot
+        self.variances = get_table('binomial')
+        # Taps are summed in order of offset, the same order as the scalar formula
+        self.left_taps = tuple(sorted(kernel))
+        self.right_taps = tuple(sorted((-offset, weight) for offset, weight in kernel))
+        self.pad = max(abs(offset) for offset, _ in kernel)
+        self.terms = array('d', [0.0]) * (robot.world.length + 2 * self.pad)  # u(q) is terms[q + pad]
+        self.rebuild()
+
+    def rebuild(self):
+        # Recompute every tile's term from the robot's counts
+        robot = self.robot
+        tiles = tiles_as_array(robot.world.tiles)
+        counts = np.frombuffer(robot.counts, dtype=np.uint32).reshape(-1, 2)
+        variances = self.variances.values(counts[:, 0], counts[:, 1])
+        terms = np.frombuffer(self.terms)
+        terms[self.pad:len(terms) - self.pad] = variances * np.abs(tiles - np.frombuffer(robot.posterior.prediction))
+
+    def update(self, position):
+        # Recompute the term of the tile at `position` after it was sensed
+        robot = self.robot
+        counts = robot.counts
+        variance = self.variances.value(counts[2 * position], counts[2 * position + 1])
+        self.terms[position + self.pad] = variance * abs(robot.world.tiles[position] - robot.posterior.prediction[position])
+
+    def scores(self, position):
+        # (left, right) scores of the moves from `position`
+        terms = self.terms
+        center = position + self.pad
+        left = 0
+        for offset, weight in self.left_taps:
+            left += weight * terms[center + offset]
+        right = 0
+        for offset, weight in self.right_taps:
+            right += weight * terms[center + offset]
+        return left, right
+
+    def fields(self):
+        # (left, right) scores of every position as NumPy arrays, one weighted convolution each
+        terms = np.frombuffer(self.terms)
+        length = len(terms) - 2 * self.pad
+        result = []
+        for taps in (self.left_taps, self.right_taps):
+            field = np.zeros(length)
+            for offset, weight in taps:
+                field += weight * terms[self.pad + offset:self.pad + offset + length]
+            result.append(field)
+        return tuple(result)
@@ -0,0 +1,75 @@
+import random
+from functools import partial
+from itertools import chain, islice
+import numpy as np
+
+# Block-drawn random numbers for the robots' sensor noise, actuator noise and
+# tie-breaking. Uniforms and random signs are drawn in large blocks from NumPy
+# generators and handed out one by one through C-level iterators, instead of
+# calling the `random` module every step. Uniforms and signs come from two
+# independent streams. With separate_actuator=True, actuator() gets a third
+# stream of its own; otherwise it is the same stream as random(). Separate
+# streams keep the k-th sensor and the k-th actuator draw identical across
+# runs with the same seed (common random numbers, see crn.py).
+
+class BlockRNG:
+    __slots__ = ('block_size', 'separate_actuator', 'random', 'sign', 'actuator', '_generators', '_current', '_pending')
+
+    def __init__(self, seed=None, block_size=4096, separate_actuator=False):
+        if seed is None:
+            seed = random.getrandbits(64)  # Follows random.seed(), like the rest of the scripts
+        self.block_size = block_size
+        self.separate_actuator = separate_actuator
+        streams = 3 if separate_actuator else 2
+        self._generators = [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(streams)]
+        self._current = [None] * streams  # Per stream: (generator state before the block, block iterator)
+        self._pending = [None] * streams  # Per stream: (block state, used) restored by set_state() but not drawn yet
+
+        self._start_streams((0,) * streams)
+
+    def _start_streams(self, skips):
+        # random() -> uniform float in [0, 1), sign() -> -1 or 1 with equal probability,
+        # actuator() -> uniform float in [0, 1) for the actuator noise
+        self.random = partial(next, chain.from_iterable(self._blocks(0, self._draw_uniforms, skips[0])))
+        self.sign = partial(next, chain.from_iterable(self._blocks(1, self._draw_signs, skips[1])))
+        if self.separate_actuator:
+            self.actuator = partial(next, chain.from_iterable(self._blocks(2, self._draw_uniforms, skips[2])))
+        else:
+            self.actuator = self.random
+
+    def get_state(self):
+        # Per stream: generator state at the start of the current block and how many values were used
+        state = []
+        for generator, current, pending in zip(self._generators, self._current, self._pending):
+            if current is None:
+                # A stream restored by set_state() only redraws its block on the next draw
+                state.append(pending or (generator.bit_generator.state, 0))
+            else:
+                block_state, block = current
+                state.append((block_state, self.block_size - block.__length_hint__()))
+        return tuple(state)
+
+    def set_state(self, state):
+        # Redraw the current blocks from their saved generator states and skip the used values
+        for generator, (block_state, _) in zip(self._generators, state):
+            generator.bit_generator.state = block_state
+        self._current = [None] * len(self._generators)
+        self._pending = list(state)
+        self._start_streams([used for _, used in state])
+
+    def _draw_uniforms(self, generator):
+        return generator.random(self.block_size).tolist()
+
+    def _draw_signs(self, generator):
+        return (generator.integers(0, 2, self.block_size) * 2 - 1).tolist()
+
+    def _blocks(self, stream, draw, skip=0):
+        generator = self._generators[stream]
+        while True:
+            state = generator.bit_generator.state
+            block = iter(draw(generator))
+            self._current[stream] = (state, block)
+            if skip:
+                next(islice(block, skip - 1, skip), None)  # Drop the first `skip` values
+                skip = 0
+            yield block
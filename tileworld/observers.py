@@ -0,0 +1,94 @@
+# Step observers for Robot.run(..., observers=[...]).
+# An observer overrides any of on_sense, on_action and on_step; only the
+# overridden callbacks are called, and only on every `every`-th step. Robot.run
+# only hands over to run_observed() when observers are passed, so runs without
+# observers keep the plain step loop.
+
+class StepObserver:
+    every = 1  # Call the callbacks on every n-th step only
+
+    def on_sense(self, step, position, color):
+        pass
+
+    def on_action(self, step, position, action):
+        pass
+
+    def on_step(self, step, position, color, action):
+        pass
+
+    def close(self):
+        # Called when the run ends
+        pass
+
+
+class CallbackObserver(StepObserver):
+    # Observer built from plain functions
+    def __init__(self, on_sense=None, on_action=None, on_step=None, every=1):
+        self.every = every
+        if on_sense is not None:
+            self.on_sense = on_sense
+        if on_action is not None:
+            self.on_action = on_action
+        if on_step is not None:
+            self.on_step = on_step
+
+
+class BufferedObserver(StepObserver):
+    # Collects (step, position, color, action) rows and hands them to callback(batch) batch_size at a time
+    def __init__(self, callback, batch_size=1024, every=1):
+        self.callback = callback
+        self.batch_size = batch_size
+        self.every = every
+        self.batch = []
+
+    def on_step(self, step, position, color, action):
+        self.batch.append((step, position, color, action))
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.batch:
+            self.callback(self.batch)
+            self.batch = []
+
+    def close(self):
+        self.flush()
+
+
+def _overrides(observer, name):
+    return name in vars(observer) or getattr(type(observer), name) is not getattr(StepObserver, name)
+
+
+def run_observed(robot, steps, observers, choose_action, stop=None):
+    # Copy of Robot.run that reports every step to the observers; `choose_action` is the strategy
+    # function Robot.run already looked up. Returns the number of steps executed
+    on_sense = [(o.every, o.on_sense) for o in observers if _overrides(o, 'on_sense')]
+    on_action = [(o.every, o.on_action) for o in observers if _overrides(o, 'on_action')]
+    on_step = [(o.every, o.on_step) for o in observers if _overrides(o, 'on_step')]
+
+    executed = steps
+    try:
+        if stop is not None and stop.start(robot):
+            return 0
+        for step in range(steps):
+            position = robot.position
+            old_variance = robot.tile_variance(position) if stop is not None else None
+            color = robot.sense()
+            for every, callback in on_sense:
+                if step % every == 0:
+                    callback(step, position, color)
+            if stop is not None and stop.update(position, old_variance, robot.tile_variance(position)):
+                executed = step + 1
+                break
+            action = choose_action(robot)
+            for every, callback in on_action:
+                if step % every == 0:
+                    callback(step, position, action)
+            for every, callback in on_step:
+                if step % every == 0:
+                    callback(step, position, color, action)
+            robot.move(action)
+    finally:
+        for observer in observers:
+            observer.close()
+    return executed
@@ -0,0 +1,145 @@
+import random
+import time
+from .uncertainty_table import get_table
+
+# k-step lookahead strategy. Instead of comparing the two neighbours, the
+# planner looks `depth` steps ahead over the robot's belief state (the counts
+# around it) and picks the first move with the largest expected reduction of
+# posterior variance. Every step of a plan branches on
+#   - the move: the intended direction, or the opposite one with probability
+#     noise_level (the flip in move()), clamped at the world edges;
+#   - the observation: white with the Beta predictive probability of the tile,
+#     passed through the sensor flip, which then updates the counts as sense()
+#     would.
+# The reward of a step is the drop of the sensed tile's variance (looked up in
+# uncertainty_table.py for the robot's model).
+#
+# Values of belief states are memoized in a transposition cache keyed on
+# (model, noise level, world length, position, remaining depth, counts of the
+# tiles still reachable), so subtrees reached by different move orders, or
+# again on the next step, are not expanded twice. Planning is iterative
+# deepening that visits at most `budget` belief states per decision (each visit
+# costs at most eight reward evaluations); when the budget runs out, the last
+# fully searched depth decides.
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+class LookaheadPlanner:
+    def __init__(self, depth=2, budget=500, max_cache=200000):
+        self.depth = depth
+        self.budget = budget  # Maximum number of belief states visited per decision
+        self.max_cache = max_cache  # The cache is cleared when it reaches this many entries
+        self.cache = {}
+        self.visited = 0  # Belief states visited in the current decision
+        self.decisions = 0
+        self.cache_hits = 0
+        self.truncated = 0  # Decisions where the budget stopped the search before `depth`
+
+    def __call__(self, robot):
+        # Strategy interface: returns -1 (left) or 1 (right)
+        position = robot.position
+        self._length = robot.world.length
+        self._lo = max(0, position - self.depth)
+        self._local = list(robot.counts[2 * self._lo:2 * (min(self._length - 1, position + self.depth) + 1)])
+        self._noise = robot.noise_level
+        self._variance = get_table(robot.model).value
+        self._config = (robot.model, robot.noise_level, self._length)
+        self.visited = 0
+        self.decisions += 1
+
+        scores = None
+        for depth in range(1, self.depth + 1):
+            try:
+                scores = (self._q(position, -1, depth), self._q(position, 1, depth))
+            except _BudgetExceeded:
+                self.truncated += 1
+                break
+
+        if scores is None:
+            return robot.rng.sign()
+        left, right = scores
+        if left > right:
+            return -1  # Move left
+        elif right > left:
+            return 1  # Move right
+        else:
+            return robot.rng.sign()  # Random choice if the expected gain is equal
+
+    def _q(self, position, action, depth):
+        # Expected variance reduction of trying `action` and then planning depth - 1 more steps
+        noise = self._noise
+        last = self._length - 1
+        value = (1 - noise) * self._arrive(max(0, min(position + action, last)), depth)
+        if noise:
+            value += noise * self._arrive(max(0, min(position - action, last)), depth)
+        return value
+
+    def _arrive(self, position, depth):
+        # Expected reward of sensing `position`, plus the value of the rest of the plan
+        local = self._local
+        index = 2 * (position - self._lo)
+        black_count, white_count = local[index], local[index + 1]
+        before = self._variance(black_count, white_count)
+        white = (white_count + 1) / (black_count + white_count + 2)
+        perceived_white = white * (1 - self._noise) + (1 - white) * self._noise
+
+        value = 0.0
+        for color, probability in ((0, 1 - perceived_white), (1, perceived_white)):
+            local[index + color] += 1
+            gain = before - self._variance(local[index], local[index + 1])
+            value += probability * (gain + self._value(position, depth - 1))
+            local[index + color] -= 1
+        return value
+
+    def _value(self, position, depth):
+        # Best expected variance reduction of the next `depth` steps from `position`
+        if depth == 0:
+            return 0.0
+        self.visited += 1
+        if self.visited > self.budget:
+            raise _BudgetExceeded
+        lo = max(self._lo, position - depth)
+        hi = min(self._length - 1, position + depth)
+        key = (self._config, position, depth, tuple(self._local[2 * (lo - self._lo):2 * (hi - self._lo + 1)]))
+        value = self.cache.get(key)
+        if value is not None:
+            self.cache_hits += 1
+        else:
+            value = max(self._q(position, -1, depth), self._q(position, 1, depth))
+            if len(self.cache) >= self.max_cache:
+                self.cache.clear()
+            self.cache[key] = value
+        return value
+
+
+def main():
+    from .robot import Robot
+    from .stopping import MeanVarianceBelow
+    from .strategies import register_strategy
+    from .world import TileWorld
+
+    # Parameters
+    world_length = 200
+    noise_level = 0.1
+    target_uncertainty = 0.05  # Mean posterior variance of the whole map
+    max_steps = 200000
+    runs = 5
+
+    for depth in [1, 2, 3, 4]:
+        register_strategy(f'lookahead_{depth}')(LookaheadPlanner(depth=depth, budget=5000))
+    for strategy in ['adventurous', 'adventurous_global', 'lookahead_1', 'lookahead_2', 'lookahead_3', 'lookahead_4']:
+        steps = []
+        start = time.perf_counter()
+        for run in range(runs):
+            random.seed(run)
+            robot = Robot(TileWorld(world_length, 'hash', seed=run), seed=run, noise_level=noise_level)
+            steps.append(robot.run(max_steps, strategy, stop=MeanVarianceBelow(target_uncertainty)))
+        elapsed = time.perf_counter() - start
+        print(f"{strategy:>12}: {sum(steps) / runs:9.0f} steps to mean variance {target_uncertainty} "
+              f"({elapsed / sum(steps) * 1e6:.1f} us/step)")
+
+# Run the main function
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+from array import array
+import numpy as np
+from .uncertainty_table import get_table
+
+# Per-tile Beta(alpha, beta) posterior statistics, kept up to date in O(1)
+# every time a tile is sensed. With a uniform prior, alpha = white_count + 1
+# and beta = black_count + 1, so mean and variance have a closed form and no
+# SciPy call is needed in the step loop. BinomialPosterior keeps the same
+# cache but uses the binomial variance of the white fraction instead.
+
+class BetaPosterior:
+    __slots__ = ('alpha', 'beta', 'mean', 'variance', 'prediction')
+    model = 'beta'  # Variance formula, see uncertainty_table.py
+
+    def __init__(self, length):
+        self.alpha = array('d', [1.0]) * length
+        self.beta = array('d', [1.0]) * length
+        self.mean = array('d', [0.5]) * length  # Posterior mean alpha / (alpha + beta)
+        self.variance = array('d', [0.25]) * length  # mean * (1 - mean) / (total_count + 1)
+        self.prediction = array('d', [0.5]) * length  # white_count / total_count, 0.5 with no data
+
+    def update(self, position, color):
+        if color == 0:
+            self.beta[position] += 1
+        else:
+            self.alpha[position] += 1
+        self.refresh(position)
+
+    def refresh(self, position):
+        # Recompute the cached values of one tile from its alpha and beta
+        a = self.alpha[position]
+        total = a + self.beta[position]  # total_count + 2
+        mean = a / total
+        self.mean[position] = mean
+        self.variance[position] = mean * (1 - mean) / (total - 1)
+        self.prediction[position] = (a - 1) / (total - 2) if total > 2 else 0.5
+
+    def to_bytes(self):
+        # Immutable copy of all cached arrays, for snapshots
+        return tuple(getattr(self, name).tobytes() for name in BetaPosterior.__slots__)
+
+    def load_bytes(self, state):
+        # Copy a to_bytes() result back in place
+        for name, data in zip(BetaPosterior.__slots__, state):
+            memoryview(getattr(self, name)).cast('B')[:] = data
+
+    def load_counts(self, counts):
+        # Rebuild every tile's statistics from a flat [black, white, ...] counts array
+        counts = np.frombuffer(counts, dtype=np.uint32).reshape(-1, 2)
+        stats = self.all_tiles()
+        stats['variance'][:] = get_table(self.model).values(counts[:, 0], counts[:, 1])
+        counts = counts.astype(float)
+        alpha = counts[:, 1] + 1
+        beta = counts[:, 0] + 1
+        total = alpha + beta
+        stats['alpha'][:] = alpha
+        stats['beta'][:] = beta
+        stats['mean'][:] = alpha / total
+        with np.errstate(invalid='ignore'):
+            stats['prediction'][:] = np.where(total > 2, (alpha - 1) / (total - 2), 0.5)
+
+    def clear(self):
+        self.load_bytes(type(self)(len(self.alpha)).to_bytes())
+
+    def all_tiles(self):
+        # NumPy views over every tile's statistics (no copy; copy them if they must outlive further updates)
+        return {
+            'alpha': np.frombuffer(self.alpha),
+            'beta': np.frombuffer(self.beta),
+            'mean': np.frombuffer(self.mean),
+            'variance': np.frombuffer(self.variance),
+            'prediction': np.frombuffer(self.prediction),
+        }
+
+
+class BinomialPosterior(BetaPosterior):
+    # variance = p * (1 - p) / total_count with p = white_count / total_count, 0.25 with no data
+    __slots__ = ()
+    model = 'binomial'
+
+    def refresh(self, position):
+        a = self.alpha[position]
+        total = a + self.beta[position]  # total_count + 2
+        self.mean[position] = a / total
+        if total > 2:
+            p = (a - 1) / (total - 2)
+            self.prediction[position] = p
+            self.variance[position] = p * (1 - p) / (total - 2)
+        else:
+            self.prediction[position] = 0.5
+            self.variance[position] = 0.25
+
+
+POSTERIOR_MODELS = {'beta': BetaPosterior, 'binomial': BinomialPosterior}
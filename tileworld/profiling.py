@@ -0,0 +1,110 @@
+import json
+import time
+
+# Per-phase profiling of Robot.run(..., profiler=PhaseProfiler()).
+# Every `sample_every`-th step is timed phase by phase (sense, choose_action per
+# strategy, calculate_uncertainty, move) with perf_counter_ns; the cost of the
+# timer itself is measured once and subtracted. Only aggregated counters are
+# kept. Robot.run only hands over to the profiler when one is passed, so the
+# normal step loop is untouched.
+
+class PhaseProfiler:
+    def __init__(self, sample_every=1):
+        self.sample_every = sample_every
+        self.calls = {}  # Phase name -> number of timed calls
+        self.total_ns = {}  # Phase name -> total time of the timed calls
+        self.steps = 0
+        self.sampling = False  # True while a sampled step is running
+        self.timer_overhead_ns = self._measure_timer_overhead()
+
+    @staticmethod
+    def _measure_timer_overhead(samples=10000):
+        clock = time.perf_counter_ns
+        start = clock()
+        for _ in range(samples):
+            clock()
+        return (clock() - start) / samples
+
+    def add(self, phase, elapsed_ns):
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        self.total_ns[phase] = self.total_ns.get(phase, 0) + max(elapsed_ns - self.timer_overhead_ns, 0)
+
+    def run(self, robot, steps, strategy, choose_action, stop=None):
+        # Instrumented copy of Robot.run; `choose_action` is the strategy function Robot.run already
+        # looked up for the strategy named `strategy`. Returns the number of steps executed
+        clock = time.perf_counter_ns
+        choose_phase = f'choose_action[{strategy}]'
+
+        # Time calculate_uncertainty through a subclass that only this robot uses for the duration of the run
+        original_class = robot.__class__
+        if hasattr(original_class, 'calculate_uncertainty'):
+            robot.__class__ = self._timed_class(original_class)
+
+        try:
+            if stop is not None and stop.start(robot):
+                return 0
+            for step in range(1, steps + 1):
+                position = robot.position
+                old_variance = robot.tile_variance(position) if stop is not None else None
+                self.sampling = self.steps % self.sample_every == 0
+                self.steps += 1
+                if not self.sampling:
+                    robot.sense()
+                    if stop is not None and stop.update(position, old_variance, robot.tile_variance(position)):
+                        return step
+                    robot.move(choose_action(robot))
+                    continue
+
+                start = clock()
+                robot.sense()
+                self.add('sense', clock() - start)
+                if stop is not None and stop.update(position, old_variance, robot.tile_variance(position)):
+                    return step
+                start = clock()
+                action = choose_action(robot)
+                self.add(choose_phase, clock() - start)
+                start = clock()
+                robot.move(action)
+                self.add('move', clock() - start)
+            return steps
+        finally:
+            self.sampling = False
+            robot.__class__ = original_class
+
+    def _timed_class(self, robot_class):
+        profiler = self
+        clock = time.perf_counter_ns
+        untimed = robot_class.calculate_uncertainty
+
+        def calculate_uncertainty(robot, *args):
+            # Only timed during sampled steps
+            if not profiler.sampling:
+                return untimed(robot, *args)
+            start = clock()
+            uncertainty = untimed(robot, *args)
+            profiler.add('calculate_uncertainty', clock() - start)
+            return uncertainty
+
+        return type(robot_class.__name__, (robot_class,), {'__slots__': (), 'calculate_uncertainty': calculate_uncertainty})
+
+    def to_dict(self):
+        phases = {}
+        for phase, calls in self.calls.items():
+            phases[phase] = {
+                'timed_calls': calls,
+                'total_ns': self.total_ns[phase],
+                'mean_ns': self.total_ns[phase] / calls,
+            }
+        return {'steps': self.steps, 'sample_every': self.sample_every, 'timer_overhead_ns': self.timer_overhead_ns, 'phases': phases}
+
+    def to_json(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def summary(self):
+        # Text table; calculate_uncertainty time is included in choose_action time
+        lines = [f"{'phase':<36} {'timed calls':>12} {'mean ns':>10} {'share':>7}"]
+        step_ns = sum(total for phase, total in self.total_ns.items() if phase != 'calculate_uncertainty') or 1
+        for phase, stats in self.to_dict()['phases'].items():
+            lines.append(f"{phase:<36} {stats['timed_calls']:>12} {stats['mean_ns']:>10.0f} {stats['total_ns'] / step_ns:>7.1%}")
+        return '\n'.join(lines)
@@ -0,0 +1,174 @@
+import random
+from collections import namedtuple
+import numpy as np
+from .neighbour_field import NeighbourField
+from .noise_rng import BlockRNG
+from .observers import run_observed
+from .posterior_stats import POSTERIOR_MODELS
+from .strategies import get_strategy
+from .trajectory import ArrayTrajectory
+from .world_model import WorldModel, new_counts
+
+# Shared simulation core of every robot script. The scripts only differ in
+# configuration: the posterior model ('beta' or 'binomial' variance), the noise
+# level, the default strategy (see strategies.py) and the number of random
+# exploration steps before the strategy takes over.
+
+# Saved robot state; the byte strings are immutable, so one snapshot can be restored or forked any number of times
+RobotSnapshot = namedtuple('RobotSnapshot', ['position', 'noise_level', 'counts', 'posterior', 'rng_state',
+                                             'exploration_phase', 'exploration_steps'])
+
+class Robot:
+    __slots__ = ('world', 'position', 'rng', 'counts', 'world_model', 'posterior', 'uncertainty_index', 'neighbour_field',
+                 'history', 'model', 'noise_level', 'strategy', 'exploration_phase', 'exploration_steps', 'initial_exploration_steps')
+
+    def __init__(self, world, trajectory=None, seed=None, model='beta', noise_level=0.0, strategy='cautious', exploration_steps=0,
+                 separate_streams=False):
+        if model not in POSTERIOR_MODELS:
+            raise ValueError(f"Unknown model {model!r}. Choose one of: {', '.join(POSTERIOR_MODELS)}.")
+        get_strategy(strategy)  # Fail early on an unknown default strategy
+
+        self.world = world
+        if seed is None:
+            self.position = random.randint(0, self.world.length - 1)
+        else:
+            # Seeded robots take the start position from their seed, so the seed alone reproduces the run
+            self.position = int(np.random.default_rng(seed).integers(self.world.length))
+        # Block-drawn noise and tie-break randomness; separate_streams gives the actuator its own stream (see noise_rng.py)
+        self.rng = BlockRNG(seed, separate_actuator=separate_streams)
+        self.counts = new_counts(self.world.length)  # Histogram: [black_count, white_count] per tile
+        self.world_model = WorldModel(self.counts)  # Read-only view: world_model[i] -> (black_count, white_count)
+        self.model = model
+        self.posterior = POSTERIOR_MODELS[model](self.world.length)  # Cached posterior statistics per tile
+        self.uncertainty_index = None  # Built on first use by the global adventurous strategy
+        self.neighbour_field = None  # Built on first use by the neighbour-weighted strategies
+        self.history = trajectory if trajectory is not None else ArrayTrajectory()  # Visited positions (see trajectory.py)
+        self.set_noise_level(noise_level)
+        self.strategy = strategy
+        self.initial_exploration_steps = exploration_steps  # Configured length of the exploration phase, used by reset()
+        self.exploration_phase = exploration_steps > 0
+        self.exploration_steps = exploration_steps
+
+    def snapshot(self):
+        # Trajectory history is not part of the snapshot
+        return RobotSnapshot(self.position, self.noise_level, self.counts.tobytes(), self.posterior.to_bytes(), self.rng.get_state(),
+                             self.exploration_phase, self.exploration_steps)
+
+    def restore(self, snapshot):
+        self.position = snapshot.position
+        self.noise_level = snapshot.noise_level
+        memoryview(self.counts).cast('B')[:] = snapshot.counts  # In place, so world_model stays valid
+        self.posterior.load_bytes(snapshot.posterior)
+        self.rng.set_state(snapshot.rng_state)
+        self.exploration_phase = snapshot.exploration_phase
+        self.exploration_steps = snapshot.exploration_steps
+        self.uncertainty_index = None  # Rebuilt on next use
+        if self.neighbour_field is not None:
+            self.neighbour_field.rebuild()
+
+    def fork(self, trajectory=None, seed=None):
+        # New robot of the same class and configuration starting from this robot's current state;
+        # with a seed it gets its own random stream
+        robot = object.__new__(type(self))
+        Robot.__init__(robot, self.world, trajectory, 0, self.model, self.noise_level, self.strategy,
+                       self.initial_exploration_steps, separate_streams=self.rng.separate_actuator)
+        robot.restore(self.snapshot())
+        if self.neighbour_field is not None:
+            robot.set_neighbour_kernel(self.neighbour_field.left_taps)
+        if seed is not None:
+            robot.rng = BlockRNG(seed, separate_actuator=self.rng.separate_actuator)
+        return robot
+
+    def reset(self, trajectory=None):
+        # Forget everything sensed so far and start the exploration phase again; position, noise level and
+        # random stream are kept. The history starts over in `trajectory` (a new in-memory one by default),
+        # and the old trajectory is closed, so a streamed one is complete on disk
+        memoryview(self.counts).cast('B')[:] = bytes(len(self.counts) * self.counts.itemsize)
+        self.posterior.clear()
+        self.history.close()
+        self.history = trajectory if trajectory is not None else ArrayTrajectory()
+        self.exploration_phase = self.initial_exploration_steps > 0
+        self.exploration_steps = self.initial_exploration_steps
+        self.uncertainty_index = None
+        if self.neighbour_field is not None:
+            self.neighbour_field.rebuild()
+
+    def set_noise_level(self, noise_level):
+        # Probability that a reading or a move is flipped
+        if not 0.0 <= noise_level <= 0.5:
+            raise ValueError("Noise level must be between 0.0 (no noise) and 0.5 (readings and moves are coin flips).")
+        self.noise_level = noise_level
+
+    def set_neighbour_kernel(self, kernel):
+        # (offset, weight) pairs scoring a move to the left for the neighbour-weighted strategies,
+        # e.g. ((-1, 0.6), (1, 0.4)); a move to the right uses the mirror image (see neighbour_field.py)
+        self.neighbour_field = NeighbourField(self, kernel)
+
+    def sense(self):
+        # Simulate perception, flipping the colour with probability equal to the noise level
+        position = self.position
+        perceived_color = self.world.tiles[position]
+        if self.noise_level and self.rng.random() < self.noise_level:
+            perceived_color = 1 - perceived_color
+
+        # Update the histogram and posterior statistics for the current position
+        self.counts[2 * position + perceived_color] += 1
+        self.posterior.update(position, perceived_color)
+        if self.uncertainty_index is not None:
+            self.uncertainty_index.update(position, self.posterior.variance[position])
+        if self.neighbour_field is not None:
+            self.neighbour_field.update(position)
+
+        self.history.append(position)
+        return perceived_color
+
+    def predict_color(self, position):
+        return self.posterior.prediction[position]  # 0.5 when no data
+
+    def tile_variance(self, position):
+        return self.posterior.variance[position]
+
+    def calculate_uncertainty(self, position):
+        if position < 0 or position >= self.world.length:
+            return float('inf')  # High uncertainty if out of bounds
+
+        return self.posterior.variance[position]  # 0.25 (maximum uncertainty) when no data
+
+    def choose_action(self, strategy=None):
+        return get_strategy(strategy or self.strategy)(self)
+
+    def move(self, action):
+        # Simulate action, flipping it with probability equal to the noise level
+        if self.noise_level and self.rng.actuator() < self.noise_level:
+            action = -action
+
+        self.position += action
+        self.position = max(0, min(self.position, self.world.length - 1))
+
+    def run(self, steps, strategy=None, stop=None, profiler=None, observers=None):
+        # Returns the number of steps executed; `strategy` defaults to the robot's own, `stop` is an optional
+        # criterion from stopping.py, `profiler` an optional PhaseProfiler from profiling.py and `observers`
+        # a list of observers.py observers
+        strategy = strategy or self.strategy
+        choose_action = get_strategy(strategy)  # Looked up once, not per step
+        if profiler is not None:
+            return profiler.run(self, steps, strategy, choose_action, stop)
+        if observers:
+            return run_observed(self, steps, observers, choose_action, stop)
+        sense, move = self.sense, self.move
+        if stop is None:
+            for _ in range(steps):
+                sense()
+                move(choose_action(self))
+            return steps
+
+        if stop.start(self):
+            return 0
+        for step in range(1, steps + 1):
+            position = self.position
+            old_variance = self.tile_variance(position)
+            sense()
+            if stop.update(position, old_variance, self.tile_variance(position)):
+                return step
+            move(choose_action(self))
+        return steps
@@ -0,0 +1,143 @@
+import time
+from collections import namedtuple
+from statistics import NormalDist
+import numpy as np
+from .crn import final_error, final_variance
+from .robot import Robot
+from .tile_storage import tiles_as_array
+from .world import TileWorld
+
+# Sequential Monte Carlo: instead of fixing the number of replicates up front,
+# a configuration is run in batches of `batch` replicates and every summary
+# metric is folded into a Welford accumulator (running mean and sum of squared
+# deviations, one pass, no stored samples). After each batch the confidence
+# interval of the chosen metric is checked, and the runner stops once its
+# half-width is at most `target`. Configurations whose results barely vary
+# stop after min_replicates, and the replicates go to the noisy ones.
+#
+# The interval is the normal approximation mean +/- z * standard error, which
+# is why at least min_replicates (30 by default) are run before checking it.
+
+# Final estimates of one configuration:
+#   replicates      number of replicates run
+#   converged       True if the target half-width was reached before max_replicates
+#   metrics         {name: (mean, half-width)} of every metric in METRICS
+#   tile_means      (L,) mean over replicates of each tile's final prediction
+#   tile_variances  (L,) mean over replicates of each tile's final posterior variance
+SequentialEstimate = namedtuple('SequentialEstimate', ['replicates', 'converged', 'metrics', 'tile_means', 'tile_variances'])
+
+
+def accuracy(robot):
+    # Fraction of tiles whose predicted colour (prediction above 0.5 is white) matches the real tile
+    tiles = tiles_as_array(robot.world.tiles)
+    return float(((robot.posterior.all_tiles()['prediction'] > 0.5) == tiles).mean())
+
+
+# Metrics of a finished replicate; 'steps' is the value returned by Robot.run, i.e. the
+# steps to convergence when a stop criterion is given
+METRICS = {
+    'accuracy': accuracy,
+    'error': final_error,
+    'variance': final_variance,
+    'steps': None,
+}
+
+
+class Welford:
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the running mean
+
+    def add(self, value):
+        # Works element-wise when value is a NumPy array
+        self.count += 1
+        delta = value - self.mean
+        self.mean = self.mean + delta / self.count
+        self.m2 = self.m2 + delta * (value - self.mean)
+
+    def merge(self, count, mean, m2):
+        # Fold in the (count, mean, m2) of another set of values (Chan et al.'s parallel update)
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean = self.mean + delta * count / total
+        self.m2 = self.m2 + m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def variance(self):
+        # Sample variance (n - 1 in the denominator)
+        return self.m2 / (self.count - 1) if self.count > 1 else float('inf')
+
+    def half_width(self, z):
+        # Half-width of the normal confidence interval of the mean
+        return z * np.sqrt(self.variance() / self.count)
+
+
+def run_until(config, world_length, steps, target, metric='accuracy', stop=None, batch=50, min_replicates=30,
+              max_replicates=100000, confidence=0.95, seed=0, world_seed=None):
+    # Runs replicates of Robot(**config) until the `confidence` interval of `metric` is at most
+    # `target` wide on each side. Every replicate gets a new world unless world_seed is given, in
+    # which case tile_means and tile_variances are per-tile estimates for that one world
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric {metric!r}. Choose one of: {', '.join(METRICS)}.")
+    if metric == 'steps' and stop is None:
+        raise ValueError("The 'steps' metric needs a stop criterion (see stopping.py).")
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    sequence = np.random.SeedSequence(seed)
+    accumulators = {name: Welford() for name in METRICS}
+    tile_means = Welford()
+    tile_variances = Welford()
+
+    replicates = 0
+    while replicates < max_replicates:
+        for replicate_sequence in sequence.spawn(min(batch, max_replicates - replicates)):
+            tile_seed, robot_seed = replicate_sequence.generate_state(2, dtype=np.uint64).tolist()
+            world = TileWorld(world_length, seed=tile_seed if world_seed is None else world_seed)
+            robot = Robot(world, seed=robot_seed, **config)
+            taken = robot.run(steps, stop=stop)
+            for name, function in METRICS.items():
+                accumulators[name].add(taken if function is None else function(robot))
+            stats = robot.posterior.all_tiles()
+            tile_means.add(stats['prediction'])
+            tile_variances.add(stats['variance'])
+            replicates += 1
+        if replicates >= min_replicates and accumulators[metric].half_width(z) <= target:
+            break
+
+    converged = accumulators[metric].half_width(z) <= target
+    metrics = {name: (float(accumulator.mean), float(accumulator.half_width(z))) for name, accumulator in accumulators.items()}
+    return SequentialEstimate(replicates, converged, metrics, tile_means.mean, tile_variances.mean)
+
+
+def main():
+    from .stopping import MeanVarianceBelow
+
+    # Parameters
+    world_length = 6
+    steps = 40
+    target = 0.01  # Half-width of the 95% interval of the accuracy
+
+    print(f"Replicates until the 95% interval of the accuracy after {steps} steps is within +/-{target}:")
+    for strategy in ['cautious', 'adventurous']:
+        for noise_level in [0.0, 0.1, 0.4]:
+            start = time.perf_counter()
+            estimate = run_until({'strategy': strategy, 'noise_level': noise_level}, world_length, steps, target)
+            mean, half_width = estimate.metrics['accuracy']
+            print(f"  {strategy:>11}, noise {noise_level:.1f}: accuracy {mean:.3f} +/- {half_width:.3f} "
+                  f"after {estimate.replicates:5d} replicates ({time.perf_counter() - start:.1f} s)")
+
+    print("\nSteps until the mean variance is below 0.05 (adventurous, 10% noise, 95% interval within +/-1 step):")
+    estimate = run_until({'strategy': 'adventurous', 'noise_level': 0.1}, world_length, 10000, 1.0, metric='steps',
+                         stop=MeanVarianceBelow(0.05), world_seed=1)
+    mean, half_width = estimate.metrics['steps']
+    print(f"  {mean:.1f} +/- {half_width:.1f} steps after {estimate.replicates} replicates")
+    for position, (tile_mean, tile_variance) in enumerate(zip(estimate.tile_means, estimate.tile_variances)):
+        print(f"  Position {position}: Mean = {tile_mean:.3f}, Variance = {tile_variance:.3f}")
+
+# Run the main function
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# Convergence criteria for Robot.run(steps, stop=...).
+# A criterion is started once with the robot (one pass over all tiles) and is
+# then told, after every sense(), how the variance of the sensed tile changed.
+# It keeps its own running totals, so checking it costs O(1) per step.
+# The robot must provide tile_variance(position).
+
+class MeanVarianceBelow:
+    # Stop when the mean posterior variance over all tiles drops below threshold
+    def __init__(self, threshold):
+        self.threshold = threshold
+
+    def start(self, robot):
+        self.length = robot.world.length
+        self.total = sum(robot.tile_variance(position) for position in range(self.length))
+        return self.total < self.threshold * self.length
+
+    def update(self, position, old_variance, new_variance):
+        self.total += new_variance - old_variance
+        return self.total < self.threshold * self.length
+
+
+class MaxVarianceBelow:
+    # Stop when every tile's posterior variance is below threshold
+    def __init__(self, threshold):
+        self.threshold = threshold
+
+    def start(self, robot):
+        self.above = sum(robot.tile_variance(position) >= self.threshold for position in range(robot.world.length))
+        return self.above == 0
+
+    def update(self, position, old_variance, new_variance):
+        self.above += (new_variance >= self.threshold) - (old_variance >= self.threshold)
+        return self.above == 0
+
+
+class NoChange:
+    # Stop when no tile's variance has changed by more than tolerance for `patience` steps in a row
+    def __init__(self, patience, tolerance=0.0):
+        self.patience = patience
+        self.tolerance = tolerance
+
+    def start(self, robot):
+        self.unchanged = 0
+        return False
+
+    def update(self, position, old_variance, new_variance):
+        if abs(new_variance - old_variance) <= self.tolerance:
+            self.unchanged += 1
+        else:
+            self.unchanged = 0
+        return self.unchanged >= self.patience
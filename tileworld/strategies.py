@@ -0,0 +1,185 @@
+from .neighbour_field import NeighbourField
+
+# Strategy table: name -> function(robot) returning -1 (left) or 1 (right).
+# Robot.run looks the strategy up once per run, so adding a strategy is one
+# decorated function and never touches the step loop:
+#
+#   @register_strategy('stay_left')
+#   def stay_left(robot):
+#       return -1 if robot.position > 0 else 1
+
+STRATEGIES = {}
+
+
+def register_strategy(name):
+    def register(strategy):
+        STRATEGIES[name] = strategy
+        return strategy
+    return register
+
+
+def get_strategy(name):
+    try:
+        return STRATEGIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown strategy {name!r}. Choose one of: {', '.join(STRATEGIES)}.") from None
+
+
+@register_strategy('cautious')
+def cautious_strategy(robot):
+    position = robot.position
+    if position == 0:
+        return 1  # Move right if at the left edge
+    elif position == robot.world.length - 1:
+        return -1  # Move left if at the right edge
+
+    # Calculate uncertainty for left and right actions
+    left_uncertainty = robot.calculate_uncertainty(position - 1)
+    right_uncertainty = robot.calculate_uncertainty(position + 1)
+
+    # Choose action based on minimum uncertainty
+    if left_uncertainty < right_uncertainty:
+        return -1  # Move left
+    elif right_uncertainty < left_uncertainty:
+        return 1  # Move right
+    else:
+        return robot.rng.sign()  # Random choice if uncertainty is equal
+
+
+@register_strategy('adventurous')
+def adventurous_strategy(robot):
+    position = robot.position
+    if position == 0:
+        return 1  # Move right if at the left edge
+    elif position == robot.world.length - 1:
+        return -1  # Move left if at the right edge
+
+    # Calculate uncertainty for left and right actions
+    left_uncertainty = robot.calculate_uncertainty(position - 1)
+    right_uncertainty = robot.calculate_uncertainty(position + 1)
+
+    # Choose action based on maximum uncertainty
+    if left_uncertainty > right_uncertainty:
+        return -1  # Move left
+    elif right_uncertainty > left_uncertainty:
+        return 1  # Move right
+    else:
+        return robot.rng.sign()  # Random choice if uncertainty is equal
+
+
+@register_strategy('adventurous_global')
+def global_adventurous_strategy(robot):
+    if robot.uncertainty_index is None:
+        from .uncertainty_index import UncertaintyIndex  # Imported here so the module also runs as a script
+        robot.uncertainty_index = UncertaintyIndex(robot.posterior.variance)
+
+    position = robot.position
+    if position == 0:
+        return 1  # Move right if at the left edge
+    elif position == robot.world.length - 1:
+        return -1  # Move left if at the right edge
+
+    # Behave like the adventurous robot while a neighbour is among the most uncertain tiles
+    highest_uncertainty = robot.uncertainty_index.max()
+    if robot.calculate_uncertainty(position - 1) == highest_uncertainty or robot.calculate_uncertainty(position + 1) == highest_uncertainty:
+        return adventurous_strategy(robot)
+
+    # Otherwise head for the nearest of the most uncertain tiles in the world
+    target = robot.uncertainty_index.nearest_max(position)
+    return -1 if target < position else 1
+
+
+def tile_certainty(robot, position):
+    # Maximum count divided by the total count at the position, 0.5 if no data
+    black_count, white_count = robot.counts[2 * position], robot.counts[2 * position + 1]
+    total_count = black_count + white_count
+    if total_count == 0:
+        return 0.5
+    return max(black_count, white_count) / total_count
+
+
+@register_strategy('general')
+def general_strategy(robot):
+    # Exploration phase to encourage visiting new positions
+    if robot.exploration_phase:
+        if robot.exploration_steps > 0:
+            robot.exploration_steps -= 1
+            return robot.rng.sign()
+        else:
+            robot.exploration_phase = False
+
+    position = robot.position
+    if position == 0:
+        return 1  # Move right if at the left edge
+    elif position == robot.world.length - 1:
+        return -1  # Move left if at the right edge
+
+    left_certainty = tile_certainty(robot, position - 1)
+    right_certainty = tile_certainty(robot, position + 1)
+
+    # Choose the direction with higher certainty
+    if left_certainty > right_certainty:
+        return -1  # Move left
+    elif right_certainty > left_certainty:
+        return 1  # Move right
+    else:
+        return robot.rng.sign()  # Random choice if certainty is equal
+
+
+def neighbour_scores(robot):
+    # (left, right) neighbour-weighted uncertainty of the two moves, read from the robot's field
+    if robot.neighbour_field is None:
+        robot.neighbour_field = NeighbourField(robot)
+    return robot.neighbour_field.scores(robot.position)
+
+
+@register_strategy('neighbour_cautious')
+def neighbour_cautious_strategy(robot):
+    position = robot.position
+    if position == 0:
+        return 1  # Move right if at the left edge
+    elif position == robot.world.length - 1:
+        return -1  # Move left if at the right edge
+
+    left_uncertainty, right_uncertainty = neighbour_scores(robot)
+
+    # Choose action based on minimum uncertainty
+    if left_uncertainty < right_uncertainty:
+        return -1  # Move left
+    elif right_uncertainty < left_uncertainty:
+        return 1  # Move right
+    else:
+        return robot.rng.sign()  # Random choice if uncertainty is equal
+
+
+@register_strategy('neighbour_adventurous')
+def neighbour_adventurous_strategy(robot):
+    position = robot.position
+    if position == 0:
+        return 1  # Move right if at the left edge
+    elif position == robot.world.length - 1:
+        return -1  # Move left if at the right edge
+
+    left_uncertainty, right_uncertainty = neighbour_scores(robot)
+
+    # Choose action based on maximum uncertainty
+    if left_uncertainty > right_uncertainty:
+        return -1  # Move left
+    elif right_uncertainty > left_uncertainty:
+        return 1  # Move right
+    else:
+        return robot.rng.sign()  # Random choice if uncertainty is equal
+
+
+_default_planner = None
+
+
+@register_strategy('lookahead')
+def lookahead_strategy(robot):
+    # k-step lookahead with the default planner settings; register a LookaheadPlanner(depth, budget)
+    # under another name for different settings (see planner.py)
+    global _default_planner
+    if _default_planner is None:
+        from .planner import LookaheadPlanner  # Imported here so the module also runs as a script
+        _default_planner = LookaheadPlanner()
+    return _default_planner(robot)
@@ -0,0 +1,149 @@
+import os
+import random
+import numpy as np
+
+# Storage back-ends for TileWorld.tiles.
+# - 'list':   Python list of 0/1 ints (the original representation)
+# - 'packed': 1 bit per tile in a NumPy uint8 array, generated in vectorized
+#             blocks; optionally written to a file so other processes can map it
+# - 'shared': read-only memory map of a file written by a 'packed' world
+# - 'hash':   nothing stored; tile i is a counter-based hash of (seed, i), so
+#             any process rebuilds the same world from the seed alone
+# Every back-end supports O(1) tiles[i], len() and iteration.
+
+BLOCK_BYTES = 1 << 22  # Random bytes generated per block (32M tiles)
+
+MASK64 = (1 << 64) - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+class PackedTiles:
+    __slots__ = ('length', 'bits', '_view')
+
+    def __init__(self, bits, length):
+        self.length = length
+        self.bits = bits  # Tile i is bit (i % 8) of byte i // 8
+        self._view = memoryview(bits).cast('B')  # Indexing a memoryview returns a plain int
+
+    @classmethod
+    def generate(cls, length, seed=None, path=None):
+        num_bytes = (length + 7) // 8
+        if path is None:
+            bits = np.empty(num_bytes, dtype=np.uint8)
+        else:
+            # An empty world still gets a 1-byte file (np.memmap cannot map 0 bytes); the memmap itself is
+            # kept for flush(), as a slice of it is a plain ndarray when num_bytes is 0
+            mapped = np.memmap(path, dtype=np.uint8, mode='w+', shape=(max(num_bytes, 1),))
+            bits = mapped[:num_bytes]
+
+        rng = np.random.default_rng(seed)
+        for start in range(0, num_bytes, BLOCK_BYTES):
+            end = min(start + BLOCK_BYTES, num_bytes)
+            bits[start:end] = rng.integers(0, 256, size=end - start, dtype=np.uint8)
+        if length % 8:
+            bits[-1] &= (1 << (length % 8)) - 1  # Clear the padding bits of the last byte
+
+        if path is not None:
+            mapped.flush()
+        return cls(bits, length)
+
+    @classmethod
+    def open(cls, path, length):
+        # Map a file written by generate(path=...) read-only; safe to share between processes. The length is
+        # required: the file is padded to whole bytes (and to 1 byte when empty), so its size does not give it
+        num_bytes = (length + 7) // 8
+        if os.path.getsize(path) < max(num_bytes, 1):
+            raise ValueError(f"{path} holds {os.path.getsize(path) * 8} tiles at most, expected {length}.")
+        bits = np.memmap(path, dtype=np.uint8, mode='r', shape=(max(num_bytes, 1),))[:num_bytes]
+        return cls(bits, length)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('tile index out of range')
+        return (self._view[index >> 3] >> (index & 7)) & 1
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return iter(self.to_array().tolist())
+
+    def take(self, indices):
+        # Vectorized lookup of many tiles at once
+        indices = np.asarray(indices)
+        return (self.bits[indices >> 3] >> (indices & 7).astype(np.uint8)) & 1
+
+    def to_array(self):
+        return np.unpackbits(self.bits, bitorder='little')[:self.length]
+
+    def __repr__(self):
+        if self.length <= 100:
+            return repr(self.to_array().tolist())
+        return f'PackedTiles(length={self.length})'
+
+
+def splitmix64(z):
+    # SplitMix64 finalizer on a Python int, result in [0, 2^64)
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9 & MASK64
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EB & MASK64
+    return z ^ (z >> 31)
+
+
+class HashedTiles:
+    __slots__ = ('length', 'seed', '_key')
+
+    def __init__(self, length, seed=None):
+        self.length = length
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self._key = splitmix64(self.seed & MASK64)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('tile index out of range')
+        return splitmix64((self._key + (index + 1) * GOLDEN_GAMMA) & MASK64) >> 63  # Top bit of the hash
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return (self[i] for i in range(self.length))
+
+    def take(self, indices):
+        # Vectorized version of __getitem__ (uint64 arithmetic wraps modulo 2^64)
+        z = np.uint64(self._key) + (np.asarray(indices, dtype=np.uint64) + np.uint64(1)) * np.uint64(GOLDEN_GAMMA)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        z = z ^ (z >> np.uint64(31))
+        return (z >> np.uint64(63)).astype(np.uint8)
+
+    def to_array(self):
+        return self.take(np.arange(self.length, dtype=np.uint64))
+
+    def __repr__(self):
+        if self.length <= 100:
+            return repr(self.to_array().tolist())
+        return f'HashedTiles(length={self.length}, seed={self.seed})'
+
+
+def make_tiles(length, storage='list', seed=None, path=None):
+    if storage == 'list':
+        # Initialize the world with random black(0) and white(1) tiles; a seed gives its own generator
+        rng = random if seed is None else random.Random(seed)
+        return [rng.choice([0, 1]) for _ in range(length)]
+    elif storage == 'packed':
+        return PackedTiles.generate(length, seed=seed, path=path)
+    elif storage == 'shared':
+        return PackedTiles.open(path, length)
+    elif storage == 'hash':
+        return HashedTiles(length, seed=seed)
+    else:
+        raise ValueError("Unknown tile storage. Choose 'list', 'packed', 'shared' or 'hash'.")
+
+
+def tiles_as_array(tiles):
+    # Any back-end's tiles as a NumPy array of 0/1
+    return tiles.to_array() if hasattr(tiles, 'to_array') else np.asarray(tiles, dtype=np.int8)
@@ -0,0 +1,120 @@
+from array import array
+import numpy as np
+
+# Trajectory sinks for Robot.history. Every sink has append(position), len()
+# and iteration over the recorded positions, oldest first.
+# - NoTrajectory:         records nothing
+# - ArrayTrajectory:      keeps every position in memory (default)
+# - RingBufferTrajectory: keeps only the last `size` positions
+# - StreamingTrajectory:  writes positions as uint32 to a file in chunks;
+#                         load_trajectory() memory-maps the file for analysis
+
+
+class NoTrajectory:
+    __slots__ = ()
+
+    def append(self, position):
+        pass
+
+    def __len__(self):
+        return 0
+
+    def __iter__(self):
+        return iter(())
+
+    def close(self):
+        pass
+
+
+class ArrayTrajectory(array):
+    # Unbounded in-memory history; an array('I') with a no-op close()
+    def __new__(cls, positions=()):
+        return super().__new__(cls, 'I', positions)
+
+    def close(self):
+        pass
+
+
+class RingBufferTrajectory:
+    __slots__ = ('size', 'buffer', 'total')
+
+    def __init__(self, size):
+        self.size = size
+        self.buffer = array('I', [0]) * size
+        self.total = 0  # Number of positions appended so far
+
+    def append(self, position):
+        self.buffer[self.total % self.size] = position
+        self.total += 1
+
+    def __len__(self):
+        return min(self.total, self.size)
+
+    def __iter__(self):
+        if self.total <= self.size:
+            return iter(self.buffer[:self.total])
+        start = self.total % self.size
+        return iter(self.buffer[start:] + self.buffer[:start])
+
+    def close(self):
+        pass
+
+
+class StreamingTrajectory:
+    __slots__ = ('path', 'chunk_size', 'buffer', 'file', 'total')
+
+    def __init__(self, path, chunk_size=65536):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.buffer = array('I')
+        self.file = open(path, 'wb')
+        self.total = 0  # Number of positions appended so far
+
+    def append(self, position):
+        self.buffer.append(position)
+        if len(self.buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        self.buffer.tofile(self.file)
+        self.file.flush()
+        self.total += len(self.buffer)
+        del self.buffer[:]
+
+    def __len__(self):
+        return self.total + len(self.buffer)
+
+    def __iter__(self):
+        self.flush()
+        return iter(load_trajectory(self.path).tolist())
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_trajectory(path):
+    # Memory-map a file written by StreamingTrajectory as a read-only uint32 array
+    if np.fromfile(path, dtype=np.uint8, count=1).size == 0:
+        return np.zeros(0, dtype=np.uint32)  # np.memmap cannot map an empty file
+    return np.memmap(path, dtype=np.uint32, mode='r')
+
+
+def make_trajectory(mode='memory', size=None, path=None):
+    if mode == 'off':
+        return NoTrajectory()
+    elif mode == 'memory':
+        return ArrayTrajectory()
+    elif mode == 'ring':
+        return RingBufferTrajectory(size)
+    elif mode == 'stream':
+        return StreamingTrajectory(path)
+    else:
+        raise ValueError("Unknown trajectory mode. Choose 'off', 'memory', 'ring' or 'stream'.")
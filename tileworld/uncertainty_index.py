@@ -0,0 +1,102 @@
+import time
+import numpy as np
+
+# Max segment tree over per-tile uncertainty values. A tile's value is updated
+# in O(log L) after it is sensed, and the most uncertain tile nearest to a
+# position is found in O(log L), which lets an adventurous robot head straight
+# for unexplored regions of a long world.
+
+class UncertaintyIndex:
+    def __init__(self, values):
+        self.length = len(values)
+        self.size = 1
+        while self.size < self.length:
+            self.size *= 2
+        tree = np.full(2 * self.size, -np.inf)
+        tree[self.size:self.size + self.length] = values
+        for node in range(self.size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self.tree = tree.tolist()  # Python floats: cheaper to index one at a time than NumPy
+
+    def update(self, position, value):
+        tree = self.tree
+        node = position + self.size
+        tree[node] = value
+        node //= 2
+        while node:
+            best = max(tree[2 * node], tree[2 * node + 1])
+            if tree[node] == best:
+                break  # Nothing above this node changes
+            tree[node] = best
+            node //= 2
+
+    def max(self):
+        return self.tree[1]
+
+    def first_at_least(self, start, threshold):
+        # Leftmost position >= start whose value is >= threshold, or -1
+        return self._first(1, 0, self.size - 1, start, threshold)
+
+    def last_at_least(self, end, threshold):
+        # Rightmost position <= end whose value is >= threshold, or -1
+        return self._last(1, 0, self.size - 1, end, threshold)
+
+    def nearest_max(self, position):
+        # Position of the most uncertain tile closest to `position` (ties go left)
+        best = self.tree[1]
+        left = self.last_at_least(position, best)
+        right = self.first_at_least(position, best)
+        if left < 0:
+            return right
+        if right < 0 or position - left <= right - position:
+            return left
+        return right
+
+    def _first(self, node, low, high, start, threshold):
+        if high < start or self.tree[node] < threshold:
+            return -1
+        if low == high:
+            return low
+        middle = (low + high) // 2
+        found = self._first(2 * node, low, middle, start, threshold)
+        if found < 0:
+            found = self._first(2 * node + 1, middle + 1, high, start, threshold)
+        return found
+
+    def _last(self, node, low, high, end, threshold):
+        if low > end or self.tree[node] < threshold:
+            return -1
+        if low == high:
+            return low
+        middle = (low + high) // 2
+        found = self._last(2 * node + 1, middle + 1, high, end, threshold)
+        if found < 0:
+            found = self._last(2 * node, low, middle, end, threshold)
+        return found
+
+
+def main():
+    from .robot import Robot
+    from .world import TileWorld
+
+    # Parameters
+    world_length = 100000
+    target_uncertainty = 0.1  # Mean posterior variance of the whole map
+    max_steps = 2000000
+    check_every = 1000
+
+    world = TileWorld(world_length, 'hash', seed=1)
+    for strategy in ['adventurous', 'adventurous_global']:
+        robot = Robot(world, seed=1)
+        robot.set_noise_level(0.1)
+        variances = robot.posterior.all_tiles()['variance']
+        start = time.perf_counter()
+        steps = 0
+        while steps < max_steps and variances.mean() > target_uncertainty:
+            robot.run(check_every, strategy)
+            steps += check_every
+        print(f"{strategy:>18}: {steps} steps to mean variance {variances.mean():.4f} ({time.perf_counter() - start:.1f} s)")
+
+# Run the main function
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import numpy as np
+
+# A tile's uncertainty only depends on its integer (black_count, white_count),
+# so it is computed once per pair into a 2-D table and looked up afterwards.
+# The table starts at 64 x 64 and doubles along an axis whenever a larger count
+# is looked up, up to max_count; pairs beyond that are computed directly.
+# get_table(model) returns the one table per posterior model that every robot
+# and simulator in the process shares.
+
+def beta_variance(black_count, white_count):
+    # Variance of Beta(white_count + 1, black_count + 1); 0.25 when there is no data
+    total_count = black_count + white_count
+    mean = (white_count + 1) / (total_count + 2)
+    return mean * (1 - mean) / (1 + total_count)
+
+
+def binomial_variance(black_count, white_count):
+    # p * (1 - p) / total_count with p = white_count / total_count; 0.25 when there is no data.
+    # Plain arithmetic, so it works on Python ints as well as on arrays
+    no_data = (black_count + white_count) == 0
+    total_count = black_count + white_count + no_data
+    p = (white_count + 0.5 * no_data) / total_count
+    return p * (1 - p) / total_count
+
+
+class UncertaintyTable:
+    def __init__(self, function, max_count=512, initial_count=64):
+        self.function = function
+        self.max_count = max_count
+        self.table = np.empty((0, 0))
+        self.rows = []  # table.tolist(), for scalar lookups without NumPy overhead
+        self._grow(initial_count - 1, initial_count - 1)
+
+    def _grow(self, black_count, white_count):
+        # Double each axis until it covers the count, capped at max_count
+        shape = []
+        for size, count in zip(self.table.shape, (black_count, white_count)):
+            size = max(size, 1)
+            while size <= count and size < self.max_count:
+                size *= 2
+            shape.append(min(size, self.max_count))
+        black, white = np.ogrid[:shape[0], :shape[1]]
+        self.table = np.asarray(self.function(black, white), dtype=float)
+        self.rows = self.table.tolist()
+
+    def value(self, black_count, white_count):
+        # Uncertainty of one (black_count, white_count) pair
+        if black_count >= self.max_count or white_count >= self.max_count:
+            return self.function(black_count, white_count)
+        try:
+            return self.rows[black_count][white_count]
+        except IndexError:
+            self._grow(black_count, white_count)
+            return self.rows[black_count][white_count]
+
+    def values(self, black_counts, white_counts):
+        # Uncertainty of every pair of two equally shaped count arrays
+        black_counts = np.asarray(black_counts)
+        white_counts = np.asarray(white_counts)
+        if black_counts.size == 0:
+            return np.empty(black_counts.shape)
+        rows, columns = self.table.shape
+        black_max, white_max = int(black_counts.max()), int(white_counts.max())
+        if (black_max >= rows or white_max >= columns) and (rows < self.max_count or columns < self.max_count):
+            self._grow(black_max, white_max)
+            rows, columns = self.table.shape
+
+        flat_index = np.minimum(black_counts, rows - 1) * columns + np.minimum(white_counts, columns - 1)
+        result = self.table.take(flat_index)
+        if black_max >= rows or white_max >= columns:
+            outside = (black_counts >= rows) | (white_counts >= columns)
+            result[outside] = self.function(black_counts[outside], white_counts[outside])
+        return result
+
+
+UNCERTAINTY_FUNCTIONS = {'beta': beta_variance, 'binomial': binomial_variance}
+_tables = {}
+
+
+def get_table(model):
+    # The process-wide table of a posterior model ('beta' or 'binomial'), created on first use
+    table = _tables.get(model)
+    if table is None:
+        table = _tables[model] = UncertaintyTable(UNCERTAINTY_FUNCTIONS[model])
+    return table
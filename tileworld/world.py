@@ -0,0 +1,9 @@
+from .tile_storage import make_tiles
+
+class TileWorld:
+    __slots__ = ('tiles', 'length')
+
+    def __init__(self, length, storage='list', seed=None, path=None):
+        # Initialize the world with random black(0) and white(1) tiles (storage modes: see tile_storage.py)
+        self.tiles = make_tiles(length, storage, seed=seed, path=path)
+        self.length = length
@@ -0,0 +1,32 @@
+from array import array
+from collections.abc import Mapping
+
+# Compact world model shared by the robot scripts.
+# Counts for all tiles live in one flat unsigned int array laid out as
+# [black_0, white_0, black_1, white_1, ...], so tile i, colour c is at 2 * i + c.
+
+def new_counts(length):
+    return array('I', [0]) * (2 * length)
+
+
+class WorldModel(Mapping):
+    # Read-only mapping view over a counts array: world_model[i] -> (black_count, white_count)
+    __slots__ = ('_counts',)
+
+    def __init__(self, counts):
+        self._counts = counts
+
+    def __getitem__(self, position):
+        if not 0 <= position < len(self):
+            raise KeyError(position)
+        index = 2 * position
+        return (self._counts[index], self._counts[index + 1])
+
+    def __len__(self):
+        return len(self._counts) // 2
+
+    def __iter__(self):
+        return iter(range(len(self)))
+
+    def __repr__(self):
+        return repr(dict(self.items()))